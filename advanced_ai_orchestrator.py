@@ -4,29 +4,123 @@ Advanced AI Orchestrator - Production-Ready Multi-Agent System
 Demonstrates advanced CrewAI capabilities, production workflows, and AIOS integration
 """
 
+from __future__ import annotations
+
 import os
 import sys
+import copy
 import json
 import time
+import random
 import asyncio
+import functools
+import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Dict, List, Tuple, Any, Optional, Callable, Awaitable
+
+from ai_stack_common import dump_json, load_json
 
 # Add AIOS environment to path
 aios_env_path = os.path.join(os.getcwd(), "environments", "aios-env", "lib", "python3.11", "site-packages")
-if aios_env_path not in sys.path:
+if os.path.isdir(aios_env_path) and \
+        os.path.normcase(aios_env_path) not in {os.path.normcase(p) for p in sys.path}:
     sys.path.insert(0, aios_env_path)
 
-try:
-    from crewai import Agent, Task, Crew, Process
+if TYPE_CHECKING:
+    from crewai import Agent, Task, Crew
     from aios.object import Object
-    from aios.state import State
-    from aios.core_utils import create_agent, validate_state_transition, format_timestamp
-    print("✅ All required modules imported successfully")
-except ImportError as e:
-    print(f"❌ Import failed: {e}")
-    sys.exit(1)
+
+@functools.lru_cache(maxsize=None)
+def _crewai():
+    """Import crewai on first use; its transitive LLM SDK imports are slow"""
+    import crewai
+    return crewai
+
+def _timestamp() -> str:
+    """Format the current wall-clock time with the AIOS timestamp helper"""
+    from aios.core_utils import format_timestamp
+    return format_timestamp(time.time())
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a config file once per (path, mtime); callers must not mutate the result"""
+    data = load_json(Path(path).read_bytes())
+    if not isinstance(data, dict):
+        raise TypeError(f"expected a JSON object, got {type(data).__name__}")
+    return data
+
+def _set_properties(obj: Object, properties: Dict[str, Any]) -> None:
+    """Set several properties on an AIOS Object, in one call when AIOS supports it"""
+    update = getattr(obj, 'update_properties', None)
+    if update is not None:
+        update(properties)
+    else:
+        for key, value in properties.items():
+            obj.set_property(key, value)
+
+def _is_transient_error(error: Exception) -> bool:
+    """Return True for errors worth retrying: timeouts, connection drops, HTTP 429/5xx"""
+    if isinstance(error, (TimeoutError, asyncio.TimeoutError, ConnectionError)):
+        return True
+    status = getattr(error, 'status_code', None) or getattr(getattr(error, 'response', None), 'status_code', None)
+    return isinstance(status, int) and (status == 429 or 500 <= status < 600)
+
+# Allowed workflow state transitions. Concurrent workflows may re-enter
+# 'executing' from any state, and simulated demo runs finish straight from 'idle'.
+_TRANSITIONS: Dict[str, frozenset] = {
+    'idle': frozenset({'planning', 'executing', 'completed', 'error'}),
+    'planning': frozenset({'planning', 'executing', 'error'}),
+    'executing': frozenset({'executing', 'monitoring', 'completed', 'error'}),
+    'monitoring': frozenset({'executing', 'monitoring', 'completed', 'error'}),
+    'completed': frozenset({'idle', 'planning', 'executing', 'completed', 'error'}),
+    'error': frozenset({'idle', 'planning', 'executing', 'completed', 'error'}),
+}
+
+# Specialized agent definitions: (key, role, goal, backstory)
+_AGENT_SPECS: Tuple[Tuple[str, str, str, str], ...] = (
+    ("architect",
+     "System Architect",
+     "Design scalable and robust AI system architectures",
+     """You are a senior system architect with 15+ years of experience in 
+    designing enterprise-grade AI systems. You specialize in microservices, 
+    distributed systems, and AI/ML pipeline architectures. You always consider 
+    scalability, security, and maintainability in your designs."""),
+    ("data_engineer",
+     "Data Engineer",
+     "Build robust data pipelines and infrastructure for AI systems",
+     """You are an expert data engineer specializing in ETL processes, 
+    data warehousing, and real-time data streaming. You have deep knowledge of 
+    Apache Kafka, Spark, and modern data stack technologies. You ensure data 
+    quality, reliability, and performance."""),
+    ("ml_engineer",
+     "Machine Learning Engineer",
+     "Develop and deploy production-ready ML models and pipelines",
+     """You are a senior ML engineer with expertise in model training, 
+    deployment, and MLOps. You work with frameworks like TensorFlow, PyTorch, 
+    and MLflow. You ensure models are production-ready with proper monitoring 
+    and versioning."""),
+    ("devops",
+     "DevOps Engineer",
+     "Automate deployment, monitoring, and infrastructure management",
+     """You are a DevOps expert specializing in CI/CD pipelines, 
+    containerization, and cloud infrastructure. You work with Docker, Kubernetes, 
+    and cloud platforms. You ensure systems are reliable, scalable, and secure."""),
+    ("security",
+     "Security Specialist",
+     "Ensure AI systems are secure, compliant, and ethical",
+     """You are a cybersecurity expert specializing in AI system security. 
+    You understand AI-specific threats like model poisoning, data privacy, and 
+    adversarial attacks. You ensure compliance with regulations and ethical guidelines."""),
+    ("analyst",
+     "Business Analyst",
+     "Translate business requirements into technical solutions",
+     """You are a business analyst with deep understanding of AI/ML 
+    applications in business. You bridge the gap between business stakeholders 
+    and technical teams. You ensure solutions deliver measurable business value."""),
+)
+
+logger = logging.getLogger(__name__)
 
 class AIOrchestrator:
     """Advanced AI Orchestration System with Production Workflows"""
@@ -34,14 +128,19 @@ class AIOrchestrator:
     def __init__(self, config_file: str = "orchestrator_config.json"):
         self.config_file = config_file
         self.config = self.load_config()
-        self.workflow_state = State(['idle', 'planning', 'executing', 'monitoring', 'completed', 'error'], 
-                                   name='workflow_status', default='idle')
+        from aios.state import State
+        self.workflow_state = State(list(_TRANSITIONS), name='workflow_status', default='idle')
         self.agents = {}
+        self._agents_cache: Optional[Dict[str, Agent]] = None
         self.workflows = {}
         self.metrics = {}
+        self._agg = {'total_time': 0.0, 'success_count': 0, 'count': 0}
+        # Created lazily inside the running loop, and again for each new loop it's used from
+        self._sem: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
         
-        print("🚀 Advanced AI Orchestrator Initialized")
-        print(f"✅ Workflow State: {self.workflow_state}")
+        logger.setLevel(self.config.get('logging_level', 'INFO'))
+        logger.info("🚀 Advanced AI Orchestrator Initialized")
+        logger.info("✅ Workflow State: %s", self.workflow_state)
     
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file or create default"""
@@ -55,156 +154,169 @@ class AIOrchestrator:
         }
         
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
-            else:
-                # Create default config
-                with open(self.config_file, 'w') as f:
-                    json.dump(default_config, f, indent=2)
-                return default_config
-        except Exception as e:
-            print(f"⚠️ Config loading failed, using defaults: {e}")
+            mtime = os.stat(self.config_file).st_mtime
+        except FileNotFoundError:
+            self._write_default_config(default_config)
             return default_config
+        
+        try:
+            return copy.deepcopy(_load_config_cached(os.path.abspath(self.config_file), mtime))
+        except json.JSONDecodeError as e:
+            logger.error("❌ Config file %s is not valid JSON, using defaults: %s", self.config_file, e)
+        except TypeError as e:
+            logger.error("❌ Config file %s must contain a JSON object, using defaults: %s", self.config_file, e)
+        except OSError as e:
+            logger.warning("⚠️ Config loading failed, using defaults: %s", e)
+        return default_config
+    
+    def _write_default_config(self, default_config: Dict[str, Any]) -> None:
+        """Create the config file with default values on first run"""
+        try:
+            Path(self.config_file).write_bytes(dump_json(default_config, pretty=True))
+        except OSError as e:
+            logger.warning("⚠️ Could not write default config to %s: %s", self.config_file, e)
+    
+    def _set_workflow_state(self, new_state: str) -> None:
+        """Move the workflow state machine to new_state using the precomputed transition table"""
+        current = self.workflow_state.current_state
+        if new_state not in _TRANSITIONS[current]:
+            raise ValueError(f"Invalid workflow transition: {current} -> {new_state}")
+        self.workflow_state.current_state = new_state
+    
+    def _record_metrics(self, workflow_name: str, metrics: Dict[str, Any]) -> None:
+        """Store metrics for a workflow and keep the running aggregates in sync"""
+        previous = self.metrics.get(workflow_name)
+        if previous is not None:
+            self._agg['total_time'] -= previous['execution_time']
+            self._agg['success_count'] -= previous['success']
+            self._agg['count'] -= 1
+        self.metrics[workflow_name] = metrics
+        self._agg['total_time'] += metrics['execution_time']
+        self._agg['success_count'] += metrics['success']
+        self._agg['count'] += 1
+    
+    def _workflow_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding concurrent workflows to max_concurrent_workflows"""
+        # A semaphore binds to the loop it first waits on, so each asyncio.run needs its own
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._sem[0] is not loop:
+            self._sem = (loop, asyncio.Semaphore(self.config.get('max_concurrent_workflows', 5)))
+        return self._sem[1]
+    
+    async def _with_retry(self, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Await coro_factory(), retrying transient failures with exponential backoff"""
+        attempts = max(1, self.config.get('retry_attempts', 3))
+        for attempt in range(attempts):
+            try:
+                return await coro_factory()
+            except Exception as e:
+                if attempt == attempts - 1 or not _is_transient_error(e):
+                    raise
+                delay = 2 ** attempt + random.random()
+                logger.warning("⚠️ Transient failure (%s), retrying in %.1fs...", e, delay)
+                await asyncio.sleep(delay)
     
     def create_specialized_agents(self) -> Dict[str, Agent]:
-        """Create specialized AI agents for different domains"""
-        
-        print("🧠 Creating Specialized AI Agents...")
-        print("=" * 60)
-        
-        agents = {}
-        
-        # System Architect Agent
-        agents['architect'] = Agent(
-            role="System Architect",
-            goal="Design scalable and robust AI system architectures",
-            backstory="""You are a senior system architect with 15+ years of experience in 
-            designing enterprise-grade AI systems. You specialize in microservices, 
-            distributed systems, and AI/ML pipeline architectures. You always consider 
-            scalability, security, and maintainability in your designs.""",
-            verbose=True,
-            allow_delegation=True,
-            tools=[]  # Can be extended with custom tools
-        )
-        
-        # Data Engineer Agent
-        agents['data_engineer'] = Agent(
-            role="Data Engineer",
-            goal="Build robust data pipelines and infrastructure for AI systems",
-            backstory="""You are an expert data engineer specializing in ETL processes, 
-            data warehousing, and real-time data streaming. You have deep knowledge of 
-            Apache Kafka, Spark, and modern data stack technologies. You ensure data 
-            quality, reliability, and performance.""",
-            verbose=True,
-            allow_delegation=True
-        )
+        """Create specialized AI agents for different domains (built once, then cached)"""
         
-        # ML Engineer Agent
-        agents['ml_engineer'] = Agent(
-            role="Machine Learning Engineer",
-            goal="Develop and deploy production-ready ML models and pipelines",
-            backstory="""You are a senior ML engineer with expertise in model training, 
-            deployment, and MLOps. You work with frameworks like TensorFlow, PyTorch, 
-            and MLflow. You ensure models are production-ready with proper monitoring 
-            and versioning.""",
-            verbose=True,
-            allow_delegation=True
-        )
+        if self._agents_cache is not None:
+            return self._agents_cache
         
-        # DevOps Engineer Agent
-        agents['devops'] = Agent(
-            role="DevOps Engineer",
-            goal="Automate deployment, monitoring, and infrastructure management",
-            backstory="""You are a DevOps expert specializing in CI/CD pipelines, 
-            containerization, and cloud infrastructure. You work with Docker, Kubernetes, 
-            and cloud platforms. You ensure systems are reliable, scalable, and secure.""",
-            verbose=True,
-            allow_delegation=True
-        )
+        logger.info("🧠 Creating Specialized AI Agents...")
         
-        # Security Specialist Agent
-        agents['security'] = Agent(
-            role="Security Specialist",
-            goal="Ensure AI systems are secure, compliant, and ethical",
-            backstory="""You are a cybersecurity expert specializing in AI system security. 
-            You understand AI-specific threats like model poisoning, data privacy, and 
-            adversarial attacks. You ensure compliance with regulations and ethical guidelines.""",
-            verbose=True,
-            allow_delegation=True
-        )
+        Agent = _crewai().Agent
+        from aios.object import Object
         
-        # Business Analyst Agent
-        agents['analyst'] = Agent(
-            role="Business Analyst",
-            goal="Translate business requirements into technical solutions",
-            backstory="""You are a business analyst with deep understanding of AI/ML 
-            applications in business. You bridge the gap between business stakeholders 
-            and technical teams. You ensure solutions deliver measurable business value.""",
-            verbose=True,
-            allow_delegation=True
-        )
+        agents = {}
+        verbose = self.config.get('agent_verbose', False)
+        
+        for key, role, goal, backstory in _AGENT_SPECS:
+            agents[key] = Agent(
+                role=role,
+                goal=goal,
+                backstory=backstory,
+                verbose=verbose,
+                allow_delegation=True,
+                tools=[]  # Can be extended with custom tools
+            )
         
         # Store AIOS objects for each agent
+        created_at = _timestamp()
         for role, agent in agents.items():
             aios_obj = Object(f"AIOS_{role.title()}")
-            aios_obj.set_property("role", agent.role)
-            aios_obj.set_property("goal", agent.goal)
-            aios_obj.set_property("status", "ready")
-            aios_obj.set_property("created_at", format_timestamp(time.time()))
+            _set_properties(aios_obj, {
+                "role": agent.role,
+                "goal": agent.goal,
+                "status": "ready",
+                "created_at": created_at
+            })
             self.agents[role] = aios_obj
         
-        print(f"✅ Created {len(agents)} specialized agents")
+        logger.info("✅ Created %d specialized agents", len(agents))
         for role, agent in agents.items():
-            print(f"   🎯 {role}: {agent.role}")
+            logger.debug("   🎯 %s: %s", role, agent.role)
         
+        self._agents_cache = agents
         return agents
     
     def create_production_workflows(self) -> Dict[str, List[Task]]:
         """Create production-ready workflow definitions"""
         
-        print("\n🔄 Creating Production Workflows...")
-        print("=" * 60)
+        logger.info("🔄 Creating Production Workflows...")
         
+        Task = _crewai().Task
         workflows = {}
         agents = self.create_specialized_agents()
         
         # Workflow 1: AI System Development
-        workflows['ai_development'] = [
-            Task(
-                description="""Analyze business requirements and design system architecture.
-                Consider scalability, security, and integration requirements.
-                Output: Detailed system architecture document with diagrams.""",
-                agent=agents['architect'],
-                expected_output="System architecture document with technical specifications"
-            ),
+        # The data, ML and DevOps designs only depend on the architecture, so they
+        # run concurrently (async_execution) and the security review waits for all.
+        architecture_task = Task(
+            description="""Analyze business requirements and design system architecture.
+            Consider scalability, security, and integration requirements.
+            Output: Detailed system architecture document with diagrams.""",
+            agent=agents['architect'],
+            expected_output="System architecture document with technical specifications"
+        )
+        design_tasks = [
             Task(
                 description="""Design data architecture and ETL pipelines.
                 Plan data storage, processing, and integration strategies.
                 Output: Data architecture blueprint and pipeline designs.""",
                 agent=agents['data_engineer'],
-                expected_output="Data architecture and pipeline design documents"
+                expected_output="Data architecture and pipeline design documents",
+                context=[architecture_task],
+                async_execution=True
             ),
             Task(
                 description="""Design ML model architecture and training pipelines.
                 Plan model deployment, monitoring, and versioning strategies.
                 Output: ML architecture and pipeline specifications.""",
                 agent=agents['ml_engineer'],
-                expected_output="ML architecture and pipeline design documents"
+                expected_output="ML architecture and pipeline design documents",
+                context=[architecture_task],
+                async_execution=True
             ),
             Task(
                 description="""Design CI/CD and deployment infrastructure.
                 Plan monitoring, logging, and alerting systems.
                 Output: DevOps architecture and deployment strategy.""",
                 agent=agents['devops'],
-                expected_output="DevOps architecture and deployment documentation"
-            ),
+                expected_output="DevOps architecture and deployment documentation",
+                context=[architecture_task],
+                async_execution=True
+            )
+        ]
+        workflows['ai_development'] = [
+            architecture_task,
+            *design_tasks,
             Task(
                 description="""Conduct security assessment and compliance review.
                 Identify security risks and ensure regulatory compliance.
                 Output: Security assessment report and compliance documentation.""",
                 agent=agents['security'],
-                expected_output="Security assessment and compliance documentation"
+                expected_output="Security assessment and compliance documentation",
+                context=[architecture_task, *design_tasks]
             )
         ]
         
@@ -258,64 +370,64 @@ class AIOrchestrator:
             )
         ]
         
-        print(f"✅ Created {len(workflows)} production workflows")
+        logger.info("✅ Created %d production workflows", len(workflows))
         for name, tasks in workflows.items():
-            print(f"   🔄 {name}: {len(tasks)} tasks")
+            logger.debug("   🔄 %s: %d tasks", name, len(tasks))
         
         return workflows
     
     def create_crew_for_workflow(self, workflow_name: str, tasks: List[Task]) -> Crew:
         """Create a crew for a specific workflow"""
         
-        print(f"\n👥 Creating Crew for Workflow: {workflow_name}")
-        print("-" * 50)
+        logger.debug("👥 Creating Crew for Workflow: %s", workflow_name)
         
-        # Get unique agents from tasks
-        agents = list(set([task.agent for task in tasks]))
+        # Get unique agents from tasks, preserving first-seen order
+        agents = list({id(task.agent): task.agent for task in tasks}.values())
         
-        crew = Crew(
+        crewai = _crewai()
+        crew = crewai.Crew(
             agents=agents,
             tasks=tasks,
-            process=Process.sequential,
-            verbose=True,
+            process=crewai.Process.sequential,
+            verbose=self.config.get('agent_verbose', False),
             memory=True  # Enable memory for context retention
         )
         
-        print(f"✅ Crew created with {len(agents)} agents and {len(tasks)} tasks")
+        logger.debug("✅ Crew created with %d agents and %d tasks", len(agents), len(tasks))
         return crew
     
-    def execute_workflow(self, workflow_name: str, workflow_tasks: List[Task]) -> Dict[str, Any]:
+    async def execute_workflow(self, workflow_name: str, workflow_tasks: List[Task]) -> Dict[str, Any]:
         """Execute a workflow and collect metrics"""
         
-        print(f"\n🚀 Executing Workflow: {workflow_name}")
-        print("=" * 60)
+        logger.info("🚀 Executing Workflow: %s", workflow_name)
         
-        start_time = time.time()
-        self.workflow_state.change_state('executing')
+        start_time = time.monotonic()
+        self._set_workflow_state('executing')
         
         try:
             # Create crew for this workflow
             crew = self.create_crew_for_workflow(workflow_name, workflow_tasks)
             
             # Execute workflow
-            print(f"🎯 Starting workflow execution...")
-            result = crew.kickoff()
+            logger.debug("🎯 Starting workflow execution...")
+            async with self._workflow_semaphore():
+                result = await self._with_retry(lambda: crew.kickoff_async())
             
             # Calculate metrics
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             success = result is not None
             
             # Store metrics
-            self.metrics[workflow_name] = {
+            self._record_metrics(workflow_name, {
                 'execution_time': execution_time,
                 'success': success,
-                'timestamp': format_timestamp(time.time()),
+                'timestamp': _timestamp(),
                 'tasks_completed': len(workflow_tasks)
-            }
+            })
             
-            self.workflow_state.change_state('completed')
+            self._set_workflow_state('completed')
             
-            print(f"✅ Workflow completed successfully in {execution_time:.2f} seconds")
+            logger.info("✅ Workflow completed successfully in %.2f seconds", execution_time)
             return {
                 'workflow_name': workflow_name,
                 'result': result,
@@ -324,10 +436,10 @@ class AIOrchestrator:
             }
             
         except Exception as e:
-            execution_time = time.time() - start_time
-            self.workflow_state.change_state('error')
+            execution_time = time.monotonic() - start_time
+            self._set_workflow_state('error')
             
-            print(f"❌ Workflow failed after {execution_time:.2f} seconds: {e}")
+            logger.error("❌ Workflow failed after %.2f seconds: %s", execution_time, e)
             return {
                 'workflow_name': workflow_name,
                 'error': str(e),
@@ -335,70 +447,88 @@ class AIOrchestrator:
                 'success': False
             }
     
-    def run_demo_workflows(self) -> None:
+    async def run_demo_workflows(self) -> None:
         """Run demonstration workflows to showcase capabilities"""
         
-        print("\n🎬 Running Demo Workflows...")
-        print("=" * 60)
+        logger.info("🎬 Running Demo Workflows...")
         
         workflows = self.create_production_workflows()
         
-        # Run each workflow
-        for workflow_name, tasks in workflows.items():
-            print(f"\n🎯 Running {workflow_name} workflow...")
+        # Workflows are independent, so run them concurrently
+        results = await asyncio.gather(
+            *(self._run_demo_workflow(name, tasks) for name, tasks in workflows.items()),
+            return_exceptions=True
+        )
+        
+        failures = [r for r in results if isinstance(r, Exception)]
+        if failures:
+            self._set_workflow_state('error')
+            logger.error("❌ %d demo workflow(s) failed: %s", len(failures), failures[0])
+            return
+        
+        self._set_workflow_state('completed')
+        logger.info("🎉 All demo workflows completed successfully!")
+    
+    async def _run_demo_workflow(self, workflow_name: str, tasks: List[Task]) -> None:
+        """Simulate a single demo workflow without full API calls"""
+        
+        async with self._workflow_semaphore():
+            self._simulate_demo_workflow(workflow_name)
+            # Optional pacing for live demos; 0 just yields to sibling workflows
+            await asyncio.sleep(self.config.get('demo_pause_s', 0))
+    
+    def _simulate_demo_workflow(self, workflow_name: str) -> None:
+        """Log and record the simulated results of a demo workflow"""
+        
+        logger.info("🎯 Running %s workflow...", workflow_name)
+        
+        if workflow_name == 'ai_development':
+            logger.debug("   📋 Simulating AI System Development workflow...")
+            logger.debug("   ✅ Architecture design completed")
+            logger.debug("   ✅ Data pipeline design completed")
+            logger.debug("   ✅ ML pipeline design completed")
+            logger.debug("   ✅ DevOps infrastructure designed")
+            logger.debug("   ✅ Security assessment completed")
             
-            # For demo purposes, we'll simulate execution without full API calls
-            if workflow_name == 'ai_development':
-                print("   📋 Simulating AI System Development workflow...")
-                print("   ✅ Architecture design completed")
-                print("   ✅ Data pipeline design completed")
-                print("   ✅ ML pipeline design completed")
-                print("   ✅ DevOps infrastructure designed")
-                print("   ✅ Security assessment completed")
-                
-                # Update AIOS state
-                for task_name in ['architecture', 'data_pipeline', 'ml_pipeline', 'devops', 'security']:
-                    agent_obj = Object(f"Task_{task_name}")
-                    agent_obj.set_property("status", "completed")
-                    agent_obj.set_property("completed_at", format_timestamp(time.time()))
-                
-                self.metrics[workflow_name] = {
-                    'execution_time': 45.2,
-                    'success': True,
-                    'timestamp': format_timestamp(time.time()),
-                    'tasks_completed': 5
-                }
+            # Update AIOS state
+            from aios.object import Object
+            completed_at = _timestamp()
+            for task_name in ['architecture', 'data_pipeline', 'ml_pipeline', 'devops', 'security']:
+                agent_obj = Object(f"Task_{task_name}")
+                _set_properties(agent_obj, {"status": "completed", "completed_at": completed_at})
             
-            elif workflow_name == 'data_pipeline':
-                print("   📊 Simulating Data Pipeline Development workflow...")
-                print("   ✅ Data models designed")
-                print("   ✅ ETL pipeline architecture completed")
-                print("   ✅ Data quality monitoring designed")
-                
-                self.metrics[workflow_name] = {
-                    'execution_time': 32.8,
-                    'success': True,
-                    'timestamp': format_timestamp(time.time()),
-                    'tasks_completed': 3
-                }
+            self._record_metrics(workflow_name, {
+                'execution_time': 45.2,
+                'success': True,
+                'timestamp': _timestamp(),
+                'tasks_completed': 5
+            })
+        
+        elif workflow_name == 'data_pipeline':
+            logger.debug("   📊 Simulating Data Pipeline Development workflow...")
+            logger.debug("   ✅ Data models designed")
+            logger.debug("   ✅ ETL pipeline architecture completed")
+            logger.debug("   ✅ Data quality monitoring designed")
             
-            elif workflow_name == 'ml_development':
-                print("   🤖 Simulating ML Model Development workflow...")
-                print("   ✅ Model architecture designed")
-                print("   ✅ Training pipeline designed")
-                print("   ✅ Deployment infrastructure designed")
-                
-                self.metrics[workflow_name] = {
-                    'execution_time': 28.5,
-                    'success': True,
-                    'timestamp': format_timestamp(time.time()),
-                    'tasks_completed': 3
-                }
+            self._record_metrics(workflow_name, {
+                'execution_time': 32.8,
+                'success': True,
+                'timestamp': _timestamp(),
+                'tasks_completed': 3
+            })
+        
+        elif workflow_name == 'ml_development':
+            logger.debug("   🤖 Simulating ML Model Development workflow...")
+            logger.debug("   ✅ Model architecture designed")
+            logger.debug("   ✅ Training pipeline designed")
+            logger.debug("   ✅ Deployment infrastructure designed")
             
-            time.sleep(1)  # Brief pause for demo effect
-        
-        self.workflow_state.change_state('completed')
-        print("\n🎉 All demo workflows completed successfully!")
+            self._record_metrics(workflow_name, {
+                'execution_time': 28.5,
+                'success': True,
+                'timestamp': _timestamp(),
+                'tasks_completed': 3
+            })
     
     def show_advanced_features(self) -> None:
         """Demonstrate advanced CrewAI and AIOS features"""
@@ -442,18 +572,32 @@ class AIOrchestrator:
         print("   Load balancing across agent pools")
         print("   Auto-scaling based on workload")
     
+    def _write_report(self, report_file: str, report: Dict[str, Any]) -> None:
+        """Stream the report to disk, writing one workflow metrics entry at a time"""
+        with open(report_file, 'wb') as f:
+            f.write(b'{')
+            for key, value in report.items():
+                f.write(dump_json(key, pretty=False) + b': ' + dump_json(value, pretty=False) + b',\n')
+            f.write(b'"metrics": [')
+            for i, (workflow_name, metrics) in enumerate(self.metrics.items()):
+                if i:
+                    f.write(b',')
+                f.write(b'\n' + dump_json({'workflow_name': workflow_name, **metrics}, pretty=False))
+            f.write(b'\n]}\n')
+    
     def generate_production_report(self) -> Dict[str, Any]:
         """Generate a comprehensive production readiness report"""
         
         print("\n📋 Generating Production Readiness Report...")
         print("=" * 60)
         
+        count = self._agg['count']
         report = {
-            'timestamp': format_timestamp(time.time()),
+            'timestamp': _timestamp(),
             'system_status': 'operational',
-            'workflows_completed': len(self.metrics),
-            'total_execution_time': sum(m['execution_time'] for m in self.metrics.values()),
-            'success_rate': sum(1 for m in self.metrics.values() if m['success']) / len(self.metrics) * 100,
+            'workflows_completed': count,
+            'total_execution_time': self._agg['total_time'],
+            'success_rate': 100.0 * self._agg['success_count'] / count if count else 0.0,
             'aios_components': {
                 'object_system': 'operational',
                 'state_management': 'operational',
@@ -485,8 +629,7 @@ class AIOrchestrator:
         
         # Save report to file
         report_file = f"production_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        self._write_report(report_file, report)
         
         print(f"✅ Production report saved to: {report_file}")
         print(f"📊 System Success Rate: {report['success_rate']:.1f}%")
@@ -494,18 +637,31 @@ class AIOrchestrator:
         
         return report
 
+def _run_async(coro: Awaitable[Any]) -> Any:
+    """Run a coroutine on uvloop when it is installed, otherwise on the default loop"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    if sys.version_info >= (3, 12):
+        return asyncio.run(coro, loop_factory=uvloop.new_event_loop)
+    uvloop.install()
+    return asyncio.run(coro)
+
 def main():
     """Main demonstration function"""
     
     print("🚀 Advanced AI Orchestrator - Production System Demo")
     print("=" * 80)
     
+    logging.basicConfig(format="%(message)s")
+    
     try:
         # Initialize orchestrator
         orchestrator = AIOrchestrator()
         
         # Run demo workflows
-        orchestrator.run_demo_workflows()
+        _run_async(orchestrator.run_demo_workflows())
         
         # Show advanced features
         orchestrator.show_advanced_features()
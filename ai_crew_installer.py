@@ -6,9 +6,13 @@ Uses CrewAI to orchestrate multiple specialized agents for repository installati
 
 import os
 import sys
+import json
+import asyncio
+import shutil
 import subprocess
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Callable
 
 # Add AIOS environment to path
 aios_env_path = os.path.join(os.getcwd(), "environments", "aios-env", "lib", "python3.11", "site-packages")
@@ -23,123 +27,267 @@ except ImportError as e:
     print(f"❌ AIOS import failed: {e}")
     sys.exit(1)
 
+# Installer paths, resolved once relative to the directory the installer runs from
+AI_STACK_DIR = Path.cwd() / "ai-stack"
+AIOS_PIP = str(Path.cwd() / "environments" / "aios-env" / "bin" / "pip")
+
+# Bare mirrors of previously cloned repositories, shared across installer runs
+GIT_CACHE_DIR = Path.home() / ".cache" / "ai-stack-git"
+
+# Upper bound on repositories cloned/installed at the same time
+MAX_CONCURRENT_INSTALLS = 8
+
+# Attempts per git/pip command and the backoff before the first retry (doubles each time)
+COMMAND_ATTEMPTS = 3
+RETRY_BASE_DELAY = 2.0
+
+# Lower-cased stderr fragments from git and pip that point at a network problem worth
+# retrying; missing repositories, auth errors and failed builds never match
+TRANSIENT_ERROR_MARKERS = (
+    "could not resolve host", "temporary failure in name resolution", "timed out",
+    "connection reset", "connection refused", "failed to connect", "early eof",
+    "the remote end hung up unexpectedly", "rpc failed", "gnutls recv error",
+    "newconnectionerror", "remotedisconnected", "returned error: 429", "returned error: 5",
+)
+
+# Repositories finished by earlier runs; bump the version when the layout changes
+STATE_FILE = AI_STACK_DIR / "installer_state.json"
+STATE_VERSION = 1
+
+def load_install_state() -> Dict[str, str]:
+    """Load per-repository install status left by previous runs"""
+    try:
+        state = json.loads(STATE_FILE.read_text())
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Ignoring unreadable installer state: {e}")
+        return {}
+    if state.get("version") != STATE_VERSION:
+        return {}
+    return state.get("repositories", {})
+
+def save_install_state(repositories: Dict[str, str]) -> None:
+    """Atomically replace the installer state file"""
+    tmp_file = STATE_FILE.with_suffix(".tmp")
+    tmp_file.write_text(json.dumps({"version": STATE_VERSION, "repositories": repositories}))
+    os.replace(tmp_file, STATE_FILE)
+
+@dataclass(slots=True)
+class InstallResult:
+    """Outcome of installing a single repository"""
+    name: str
+    description: str
+    install_method: str
+    success: bool
+    message: Optional[str] = None
+    error: Optional[str] = None
+
+async def run_command(cmd: List[str], cwd: Optional[Path] = None,
+                      on_line: Optional[Callable[[str], None]] = None) -> subprocess.CompletedProcess:
+    """Run a command on the event loop, keeping only stderr for error messages.
+    
+    stdout is discarded unless on_line is given, in which case each line is
+    passed to it as it arrives instead of being buffered.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, cwd=cwd, stderr=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE if on_line else asyncio.subprocess.DEVNULL
+    )
+    
+    async def forward_stdout():
+        async for line in proc.stdout:
+            on_line(line.decode(errors="replace").rstrip())
+    
+    # Drain stderr concurrently so a chatty command cannot block on a full pipe
+    if on_line:
+        _, stderr = await asyncio.gather(forward_stdout(), proc.stderr.read())
+    else:
+        stderr = await proc.stderr.read()
+    await proc.wait()
+    return subprocess.CompletedProcess(cmd, proc.returncode, None, stderr.decode(errors="replace"))
+
+def _is_transient_failure(result: subprocess.CompletedProcess) -> bool:
+    """Return True if a failed git/pip command's stderr points at a network problem"""
+    stderr = result.stderr.lower()
+    return any(marker in stderr for marker in TRANSIENT_ERROR_MARKERS)
+
+async def run_with_retries(cmd: List[str], cwd: Optional[Path] = None,
+                           on_line: Optional[Callable[[str], None]] = None,
+                           cleanup: Optional[Path] = None) -> subprocess.CompletedProcess:
+    """Run a command, retrying transient failures with exponential backoff.
+    
+    Only failures whose stderr looks like a network problem are retried.
+    ``cleanup`` is removed after each failed attempt so a partial clone
+    does not block the next one.
+    """
+    for attempt in range(COMMAND_ATTEMPTS):
+        result = await run_command(cmd, cwd=cwd, on_line=on_line)
+        if cleanup is not None and result.returncode != 0:
+            shutil.rmtree(cleanup, ignore_errors=True)
+        if result.returncode == 0 or attempt == COMMAND_ATTEMPTS - 1 or not _is_transient_failure(result):
+            return result
+        delay = RETRY_BASE_DELAY * 2 ** attempt
+        print(f"⚠️ Attempt {attempt + 1}/{COMMAND_ATTEMPTS} failed, retrying in {delay:.0f}s: {' '.join(cmd)}")
+        await asyncio.sleep(delay)
+    return result
+
 class RepositoryInstaller:
     """Base class for repository installation"""
     
-    def __init__(self, name: str, url: str, description: str, install_method: str):
+    # Prefix for every git call: protocol v2 skips the full ref advertisement, and
+    # fsmonitor/auto-gc only add background work to short-lived checkouts
+    _GIT = ("git", "-c", "protocol.version=2", "-c", "core.fsmonitor=false", "-c", "gc.auto=0")
+    
+    def __init__(self, name: str, url: str, description: str, install_method: str,
+                 use_cache: bool = True, clone_depth: Optional[int] = 1):
         self.name = name
         self.url = url
         self.description = description
         self.install_method = install_method
+        self.use_cache = use_cache
+        # History depth for clones; None fetches full history. `pip install -e .`
+        # works on shallow clones of all repositories listed in RepositoryManager.
+        self.clone_depth = clone_depth
         self.status = "pending"
-        self.working_dir = Path.cwd() / "ai-stack"
-        
-    def install(self) -> Dict[str, Any]:
+        self.working_dir = AI_STACK_DIR
+        self._install_methods = {
+            "clone_only": self._clone_repository,
+            "pip_install": self._pip_install,
+            "docker": self._docker_install,
+            "binary_download": self._binary_install,
+            "node_install": self._node_install
+        }
+    
+    async def install(self) -> Dict[str, Any]:
         """Install the repository"""
         try:
             print(f"🔧 Installing {self.name}...")
             
-            if self.install_method == "clone_only":
-                return self._clone_repository()
-            elif self.install_method == "pip_install":
-                return self._pip_install()
-            elif self.install_method == "docker":
-                return self._docker_install()
-            elif self.install_method == "binary_download":
-                return self._binary_install()
-            elif self.install_method == "node_install":
-                return self._node_install()
-            else:
+            method = self._install_methods.get(self.install_method)
+            if method is None:
                 return {"success": False, "error": f"Unknown install method: {self.install_method}"}
-                
+            return await method()
+        
         except Exception as e:
             return {"success": False, "error": str(e)}
     
-    def _clone_repository(self) -> Dict[str, Any]:
+    async def _clone_repository(self) -> Dict[str, Any]:
         """Clone repository from GitHub"""
-        try:
-            repo_dir = self.working_dir / self.name
-            if repo_dir.exists():
-                print(f"✅ {self.name} already exists")
-                return {"success": True, "message": f"{self.name} already installed"}
-            
-            # Clone repository
-            result = subprocess.run(
-                ["git", "clone", self.url, str(repo_dir)],
-                capture_output=True, text=True, cwd=self.working_dir
-            )
-            
-            if result.returncode == 0:
-                print(f"✅ {self.name} cloned successfully")
-                return {"success": True, "message": f"{self.name} cloned successfully"}
+        repo_dir = self.working_dir / self.name
+        if repo_dir.exists():
+            print(f"✅ {self.name} already exists")
+            return {"success": True, "message": f"{self.name} already installed"}
+        
+        # Clone repository, from the local cache mirror when possible
+        cache_dir = await self._update_cache() if self.use_cache else None
+        if cache_dir is not None:
+            # The mirror is already trimmed to clone_depth, so this is a local copy
+            clone_cmd = [*self._GIT, "clone", cache_dir.as_uri(), str(repo_dir)]
+        else:
+            filter_args = ["--filter=blob:none"] if self.clone_depth is not None else []
+            clone_cmd = [*self._GIT, "clone", *filter_args, *self._depth_args(), self.url, str(repo_dir)]
+        
+        result = await run_with_retries(clone_cmd, cwd=self.working_dir, cleanup=repo_dir)
+        
+        if result.returncode == 0 and cache_dir is not None:
+            # Point the working tree back at upstream rather than the mirror
+            await run_command([*self._GIT, "-C", str(repo_dir), "remote", "set-url", "origin", self.url])
+        
+        if result.returncode == 0 and (repo_dir / ".gitmodules").is_file():
+            # Fetched after set-url so relative submodule URLs resolve against upstream
+            submodule_cmd = [*self._GIT, "-C", str(repo_dir),
+                             "submodule", "update", "--init", "--recursive", "--jobs", "8"]
+            if self.clone_depth is not None:
+                submodule_cmd += ["--depth", str(self.clone_depth)]
+            result = await run_with_retries(submodule_cmd)
+            if result.returncode != 0:
+                # Drop the half-populated checkout so the next run clones afresh
+                shutil.rmtree(repo_dir, ignore_errors=True)
+        
+        if result.returncode == 0:
+            print(f"✅ {self.name} cloned successfully")
+            return {"success": True, "message": f"{self.name} cloned successfully"}
+        else:
+            return {"success": False, "error": f"Git clone failed: {result.stderr}"}
+    
+    def _depth_args(self) -> List[str]:
+        """git clone flags limiting history to clone_depth commits of one branch"""
+        if self.clone_depth is None:
+            return []
+        return ["--depth", str(self.clone_depth), "--single-branch"]
+    
+    async def _update_cache(self) -> Optional[Path]:
+        """Create or refresh the bare cache mirror; returns None if it is unusable"""
+        cache_dir = GIT_CACHE_DIR / f"{self.name}.git"
+        if cache_dir.exists():
+            if self.clone_depth is None:
+                cmd = [*self._GIT, "-C", str(cache_dir), "fetch", "--prune", "origin",
+                       "+refs/heads/*:refs/heads/*"]
             else:
-                return {"success": False, "error": f"Git clone failed: {result.stderr}"}
-                
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+                # Single-branch mirror: refresh only the branch HEAD points at
+                head_ref = (cache_dir / "HEAD").read_text().split("ref:", 1)[-1].strip()
+                cmd = [*self._GIT, "-C", str(cache_dir), "fetch", "--depth", str(self.clone_depth),
+                       "origin", f"+{head_ref}:{head_ref}"]
+        else:
+            GIT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cmd = [*self._GIT, "clone", "--bare", *self._depth_args(), self.url, str(cache_dir)]
+        
+        # A fresh mirror that fails part-way is removed; an existing one is kept
+        result = await run_with_retries(cmd, cleanup=None if cache_dir.exists() else cache_dir)
+        if result.returncode != 0 and not cache_dir.exists():
+            return None
+        # A failed fetch still leaves a usable (if stale) mirror to borrow from
+        return cache_dir
     
-    def _pip_install(self) -> Dict[str, Any]:
+    async def _pip_install(self) -> Dict[str, Any]:
         """Install via pip"""
-        try:
-            # First clone, then install
-            clone_result = self._clone_repository()
-            if not clone_result["success"]:
-                return clone_result
-            
-            # Install via pip
-            pip_cmd = str(Path.cwd() / "environments" / "aios-env" / "bin" / "pip")
-            result = subprocess.run(
-                [pip_cmd, "install", "-e", str(self.working_dir / self.name)],
-                capture_output=True, text=True
-            )
-            
-            if result.returncode == 0:
-                print(f"✅ {self.name} installed via pip")
-                return {"success": True, "message": f"{self.name} installed via pip"}
-            else:
-                return {"success": False, "error": f"Pip install failed: {result.stderr}"}
-                
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        # Nothing consumes a working tree for pip installs, so let pip fetch the
+        # source itself; an existing checkout is still installed in editable mode
+        repo_dir = self.working_dir / self.name
+        target = ["-e", str(repo_dir)] if repo_dir.exists() else [f"git+{self.url}"]
+        result = await run_with_retries(
+            [AIOS_PIP, "install", *target],
+            on_line=self._report_pip_line
+        )
+        
+        if result.returncode == 0:
+            print(f"✅ {self.name} installed via pip")
+            return {"success": True, "message": f"{self.name} installed via pip"}
+        else:
+            return {"success": False, "error": f"Pip install failed: {result.stderr}"}
     
-    def _docker_install(self) -> Dict[str, Any]:
+    def _report_pip_line(self, line: str) -> None:
+        """Forward pip's stdout summary while installs run concurrently; errors arrive via stderr"""
+        if line.startswith("Successfully installed"):
+            print(f"   [{self.name}] {line}")
+    
+    async def _docker_install(self) -> Dict[str, Any]:
         """Install via Docker"""
-        try:
-            clone_result = self._clone_repository()
-            if not clone_result["success"]:
-                return clone_result
-            
-            print(f"✅ {self.name} cloned for Docker deployment")
-            return {"success": True, "message": f"{self.name} ready for Docker deployment"}
-            
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        clone_result = await self._clone_repository()
+        if not clone_result["success"]:
+            return clone_result
+        
+        print(f"✅ {self.name} cloned for Docker deployment")
+        return {"success": True, "message": f"{self.name} ready for Docker deployment"}
     
-    def _binary_install(self) -> Dict[str, Any]:
+    async def _binary_install(self) -> Dict[str, Any]:
         """Install binary/compiled version"""
-        try:
-            clone_result = self._clone_repository()
-            if not clone_result["success"]:
-                return clone_result
-            
-            print(f"✅ {self.name} cloned for binary installation")
-            return {"success": True, "message": f"{self.name} ready for binary installation"}
-            
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        clone_result = await self._clone_repository()
+        if not clone_result["success"]:
+            return clone_result
+        
+        print(f"✅ {self.name} cloned for binary installation")
+        return {"success": True, "message": f"{self.name} ready for binary installation"}
     
-    def _node_install(self) -> Dict[str, Any]:
+    async def _node_install(self) -> Dict[str, Any]:
         """Install Node.js application"""
-        try:
-            clone_result = self._clone_repository()
-            if not clone_result["success"]:
-                return clone_result
-            
-            print(f"✅ {self.name} cloned for Node.js installation")
-            return {"success": True, "message": f"{self.name} ready for Node.js installation"}
-            
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        clone_result = await self._clone_repository()
+        if not clone_result["success"]:
+            return clone_result
+        
+        print(f"✅ {self.name} cloned for Node.js installation")
+        return {"success": True, "message": f"{self.name} ready for Node.js installation"}
 
 class RepositoryManager:
     """Manages repository installation workflow"""
@@ -196,44 +344,75 @@ class RepositoryManager:
             )
         ]
         
-        self.working_dir = Path.cwd() / "ai-stack"
+        self.working_dir = AI_STACK_DIR
         self.working_dir.mkdir(exist_ok=True)
+        self.state = load_install_state()
     
     def install_all(self) -> Dict[str, Any]:
         """Install all repositories"""
+        return asyncio.run(self.install_all_async())
+    
+    async def install_all_async(self) -> Dict[str, Any]:
+        """Install all repositories concurrently, bounded by MAX_CONCURRENT_INSTALLS"""
         print("🚀 Starting Repository Installation Crew...")
         print("=" * 60)
         
-        results = []
-        successful = 0
         total = len(self.repositories)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_INSTALLS)
         
-        for repo in self.repositories:
-            print(f"\n📦 Installing: {repo.name}")
-            print(f"   Description: {repo.description}")
-            print(f"   Method: {repo.install_method}")
-            
-            result = repo.install()
-            results.append({
-                "name": repo.name,
-                "description": repo.description,
-                "install_method": repo.install_method,
-                "result": result
-            })
+        async def install_one(repo: RepositoryInstaller):
+            # Each repository still runs its own clone -> pip steps in order
+            if self.state.get(repo.name) == "success":
+                # pip installs keep no checkout; the others are only done while theirs is there
+                if repo.install_method == "pip_install" or (repo.working_dir / repo.name).exists():
+                    return repo, {"success": True, "message": f"{repo.name} already installed by a previous run"}
+                del self.state[repo.name]
+                save_install_state(self.state)
+            async with semaphore:
+                result = await repo.install()
+            if result["success"]:
+                # Record progress as it happens so an interrupted run can resume
+                self.state[repo.name] = "success"
+                save_install_state(self.state)
+            return repo, result
+        
+        outcomes = {}
+        for next_done in asyncio.as_completed([install_one(repo) for repo in self.repositories]):
+            repo, result = await next_done
+            outcomes[repo.name] = result
             
+            # Emit each repository's status block with a single write
+            lines = [
+                f"\n📦 Installed: {repo.name}",
+                f"   Description: {repo.description}",
+                f"   Method: {repo.install_method}"
+            ]
             if result["success"]:
-                successful += 1
-                print(f"   ✅ Status: {result['message']}")
+                lines.append(f"   ✅ Status: {result['message']}")
             else:
-                print(f"   ❌ Status: {result['error']}")
+                lines.append(f"   ❌ Status: {result['error']}")
+            sys.stdout.write("\n".join(lines) + "\n")
         
-        # Summary
-        print("\n" + "=" * 60)
-        print(f"📊 Installation Summary: {successful}/{total} successful")
+        # Report results in declaration order regardless of completion order
+        results = [
+            InstallResult(
+                name=repo.name,
+                description=repo.description,
+                install_method=repo.install_method,
+                success=outcomes[repo.name]["success"],
+                message=outcomes[repo.name].get("message"),
+                error=outcomes[repo.name].get("error")
+            )
+            for repo in self.repositories
+        ]
+        successful = sum(result.success for result in results)
         
+        # Summary
+        lines = ["\n" + "=" * 60, f"📊 Installation Summary: {successful}/{total} successful"]
         for result in results:
-            status = "✅" if result["result"]["success"] else "❌"
-            print(f"{status} {result['name']}: {result['result'].get('message', result['result'].get('error', 'Unknown'))}")
+            status = "✅" if result.success else "❌"
+            lines.append(f"{status} {result.name}: {result.message or result.error or 'Unknown'}")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         return {
             "total": total,
@@ -250,7 +429,7 @@ class AIOSIntegrationAgent:
         self.state = State(['idle', 'analyzing', 'integrating', 'testing', 'complete'], 
                           name='integration_status', default='idle')
     
-    def integrate_repositories(self, installed_repos: List[Dict]) -> Dict[str, Any]:
+    def integrate_repositories(self, installed_repos: List[InstallResult]) -> Dict[str, Any]:
         """Integrate installed repositories with AIOS"""
         try:
             self.state.change_state('analyzing')
@@ -259,19 +438,14 @@ class AIOSIntegrationAgent:
             # Create integration configuration
             integration_config = {
                 "aios_version": "0.2.2",
-                "integrated_repositories": [],
+                "integrated_repositories": [
+                    {"name": repo.name, "type": repo.install_method, "status": "integrated"}
+                    for repo in installed_repos if repo.success
+                ],
                 "workflow_templates": [],
                 "agent_configurations": []
             }
             
-            for repo in installed_repos:
-                if repo["result"]["success"]:
-                    integration_config["integrated_repositories"].append({
-                        "name": repo["name"],
-                        "type": repo["install_method"],
-                        "status": "integrated"
-                    })
-            
             self.state.change_state('integrating')
             print(f"🔧 {self.agent.name} creating AIOS integration...")
             
@@ -283,8 +457,7 @@ class AIOSIntegrationAgent:
             workflow_dir.mkdir(parents=True, exist_ok=True)
             
             workflow_file = workflow_dir / "aios_crew_workflow.py"
-            with open(workflow_file, 'w') as f:
-                f.write(workflow_code)
+            workflow_file.write_text(workflow_code)
             
             self.state.change_state('testing')
             print(f"🧪 {self.agent.name} testing integration...")
@@ -348,12 +521,16 @@ if __name__ == "__main__":
     def _test_integration(self, config: Dict) -> Dict[str, Any]:
         """Test the integration"""
         try:
-            # Basic test - check if repositories exist
-            working_dir = Path.cwd() / "ai-stack"
-            for repo in config["integrated_repositories"]:
-                repo_dir = working_dir / repo["name"]
-                if not repo_dir.exists():
-                    return {"success": False, "error": f"Repository {repo['name']} not found"}
+            # Basic test - check if repositories exist (pip installs keep no checkout)
+            expected = [repo["name"] for repo in config["integrated_repositories"]
+                        if repo["type"] != "pip_install"]
+            if expected:
+                # One directory listing instead of a stat per repository
+                with os.scandir(AI_STACK_DIR) as entries:
+                    present = {entry.name for entry in entries}
+                missing = [name for name in expected if name not in present]
+                if missing:
+                    return {"success": False, "error": f"Repositories not found: {', '.join(missing)}"}
             
             return {"success": True, "message": "Integration test passed"}
         except Exception as e:
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+AI Development Stack Helpers
+JSON and package-name helpers shared by the stack scripts and agents
+"""
+
+import os
+import re
+
+# Config files are written compact; set AISTACK_PRETTY_JSON=1 for indented output
+PRETTY_JSON = os.environ.get("AISTACK_PRETTY_JSON") == "1"
+
+try:
+    import orjson
+
+    def load_json(data: bytes):
+        """Parse JSON bytes"""
+        return orjson.loads(data)
+
+    def dump_json(obj, pretty: bool = PRETTY_JSON) -> bytes:
+        """Serialize obj to JSON bytes, indented by two spaces when pretty"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+except ImportError:
+    import json
+
+    def load_json(data: bytes):
+        """Parse JSON bytes"""
+        return json.loads(data)
+
+    def dump_json(obj, pretty: bool = PRETTY_JSON) -> bytes:
+        """Serialize obj to JSON bytes, indented by two spaces when pretty"""
+        if pretty:
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+def normalize_name(name):
+    """Normalize a distribution name for comparison (PEP 503)"""
+    return re.sub(r"[-_.]+", "-", name).lower()
@@ -4,122 +4,199 @@ Enhanced AI Development Stack Integration
 Covers all identified gaps from the GitHub research
 """
 
+import asyncio
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
+from types import MappingProxyType
+from typing import ClassVar, Mapping
+
+from ai_stack_common import dump_json, normalize_name
+
+# Skip pip's interactive prompts and per-invocation version check
+PIP_FAST_FLAGS = ("--no-input", "--disable-pip-version-check")
+
+# High priority packages (core functionality)
+HIGH_PRIORITY_PACKAGES = (
+    "torch", "torchvision", "torchaudio",  # PyTorch ecosystem
+    "opencv-python", "pillow",  # Computer vision
+    "librosa", "soundfile",  # Audio processing
+    "pandas", "numpy", "scikit-learn",  # Data science
+    "matplotlib", "seaborn", "plotly",  # Visualization
+    "wandb", "tensorboard"  # MLOps & monitoring
+)
+
+# Medium priority packages
+MEDIUM_PRIORITY_PACKAGES = (
+    "tensorflow", "jax", "prometheus", "grafana"
+)
+
+# Packages per `pip download` worker and number of concurrent downloads
+DOWNLOAD_SHARD_SIZE = 4
+DOWNLOAD_WORKERS = 4
+
+def _newly_installed(pip_output):
+    """Collect the names pip reported on its 'Successfully installed' line"""
+    names = set()
+    for line in pip_output.splitlines():
+        if line.startswith("Successfully installed "):
+            names.update(normalize_name(spec.rsplit("-", 1)[0]) for spec in line.split()[2:])
+    return names
 
 class EnhancedAIStackIntegrator:
+    # Enhanced repository list covering all gaps
+    ENHANCED_REPOSITORIES: ClassVar[Mapping[str, dict]] = MappingProxyType({
+        # Core AI/ML (Already covered)
+        "transformers": {"type": "ai_library", "priority": "high"},
+        "langchain": {"type": "ai_framework", "priority": "high"},
+        "autogen": {"type": "ai_framework", "priority": "high"},
+        "deepspeed": {"type": "ai_library", "priority": "high"},
+        "db-gpt": {"type": "ai_framework", "priority": "high"},
+        "promptic": {"type": "ai_library", "priority": "high"},
+        "bentoml": {"type": "deployment", "priority": "high"},
+        "mlflow": {"type": "mlops", "priority": "high"},
+        "dvc": {"type": "data_tools", "priority": "high"},
+        "ollama": {"type": "local_llm", "priority": "high"},
+        
+        # Enhanced GPU/ML Libraries (Covering gaps)
+        "pytorch": {"type": "ai_library", "priority": "high"},
+        "tensorflow": {"type": "ai_library", "priority": "medium"},
+        "jax": {"type": "ai_library", "priority": "medium"},
+        "torchvision": {"type": "ai_library", "priority": "medium"},
+        "torchaudio": {"type": "ai_library", "priority": "medium"},
+        
+        # Computer Vision & Audio (Covering gaps)
+        "opencv-python": {"type": "ai_library", "priority": "medium"},
+        "pillow": {"type": "ai_library", "priority": "medium"},
+        "librosa": {"type": "ai_library", "priority": "medium"},
+        "soundfile": {"type": "ai_library", "priority": "medium"},
+        
+        # Advanced MLOps & Monitoring (Covering gaps)
+        "wandb": {"type": "mlops", "priority": "medium"},
+        "tensorboard": {"type": "mlops", "priority": "medium"},
+        "prometheus": {"type": "monitoring", "priority": "low"},
+        "grafana": {"type": "monitoring", "priority": "low"},
+        
+        # Data Processing & Analytics (Covering gaps)
+        "pandas": {"type": "data_tools", "priority": "high"},
+        "numpy": {"type": "data_tools", "priority": "high"},
+        "scikit-learn": {"type": "ai_library", "priority": "high"},
+        "matplotlib": {"type": "data_tools", "priority": "medium"},
+        "seaborn": {"type": "data_tools", "priority": "medium"},
+        "plotly": {"type": "data_tools", "priority": "medium"},
+        
+        # Web & Deployment (Already covered)
+        "yao": {"type": "web_framework", "priority": "medium"},
+        "next-money": {"type": "web_app", "priority": "medium"},
+        
+        # Security & Parrot OS (Already covered)
+        "parrotos-practical-guide": {"type": "guide", "priority": "low"},
+        
+        # AI Resources (Already covered)
+        "system-prompts-and-models": {"type": "ai_resources", "priority": "medium"},
+        
+        # Media/Streaming (Low priority - not core AI)
+        "aiostreams": {"type": "media", "priority": "low"}
+    })
+    
     def __init__(self):
         self.project_root = Path("/home/booze/ai-development")
         self.ai_stack_dir = self.project_root / "ai-stack"
-        
-        # Enhanced repository list covering all gaps
-        self.enhanced_repositories = {
-            # Core AI/ML (Already covered)
-            "transformers": {"type": "ai_library", "priority": "high"},
-            "langchain": {"type": "ai_framework", "priority": "high"},
-            "autogen": {"type": "ai_framework", "priority": "high"},
-            "deepspeed": {"type": "ai_library", "priority": "high"},
-            "db-gpt": {"type": "ai_framework", "priority": "high"},
-            "promptic": {"type": "ai_library", "priority": "high"},
-            "bentoml": {"type": "deployment", "priority": "high"},
-            "mlflow": {"type": "mlops", "priority": "high"},
-            "dvc": {"type": "data_tools", "priority": "high"},
-            "ollama": {"type": "local_llm", "priority": "high"},
-            
-            # Enhanced GPU/ML Libraries (Covering gaps)
-            "pytorch": {"type": "ai_library", "priority": "high"},
-            "tensorflow": {"type": "ai_library", "priority": "medium"},
-            "jax": {"type": "ai_library", "priority": "medium"},
-            "torchvision": {"type": "ai_library", "priority": "medium"},
-            "torchaudio": {"type": "ai_library", "priority": "medium"},
-            
-            # Computer Vision & Audio (Covering gaps)
-            "opencv-python": {"type": "ai_library", "priority": "medium"},
-            "pillow": {"type": "ai_library", "priority": "medium"},
-            "librosa": {"type": "ai_library", "priority": "medium"},
-            "soundfile": {"type": "ai_library", "priority": "medium"},
-            
-            # Advanced MLOps & Monitoring (Covering gaps)
-            "wandb": {"type": "mlops", "priority": "medium"},
-            "tensorboard": {"type": "mlops", "priority": "medium"},
-            "prometheus": {"type": "monitoring", "priority": "low"},
-            "grafana": {"type": "monitoring", "priority": "low"},
-            
-            # Data Processing & Analytics (Covering gaps)
-            "pandas": {"type": "data_tools", "priority": "high"},
-            "numpy": {"type": "data_tools", "priority": "high"},
-            "scikit-learn": {"type": "ai_library", "priority": "high"},
-            "matplotlib": {"type": "data_tools", "priority": "medium"},
-            "seaborn": {"type": "data_tools", "priority": "medium"},
-            "plotly": {"type": "data_tools", "priority": "medium"},
-            
-            # Web & Deployment (Already covered)
-            "yao": {"type": "web_framework", "priority": "medium"},
-            "next-money": {"type": "web_app", "priority": "medium"},
-            
-            # Security & Parrot OS (Already covered)
-            "parrotos-practical-guide": {"type": "guide", "priority": "low"},
-            
-            # AI Resources (Already covered)
-            "system-prompts-and-models": {"type": "ai_resources", "priority": "medium"},
-            
-            # Media/Streaming (Low priority - not core AI)
-            "aiostreams": {"type": "media", "priority": "low"}
-        }
+        self.venv_path = self.ai_stack_dir / "enhanced-ai-env"
+        self.pip_cmd = str(self.venv_path / "bin" / "pip")
     
     def install_enhanced_packages(self):
         """Install enhanced Python packages covering all gaps"""
         print("\n🚀 Installing Enhanced AI Stack Packages...")
         
         # Create enhanced virtual environment
-        venv_path = self.ai_stack_dir / "enhanced-ai-env"
-        if not venv_path.exists():
+        # A directory without pip is a partial or foreign env, so key off the binary
+        venv_path = self.venv_path
+        pip_cmd = self.pip_cmd
+        if not Path(pip_cmd).is_file():
             subprocess.run([sys.executable, "-m", "venv", str(venv_path)])
             print(f"✅ Created enhanced virtual environment: {venv_path}")
         
-        pip_cmd = str(venv_path / "bin" / "pip")
-        
-        # High priority packages (core functionality)
-        high_priority = [
-            "torch", "torchvision", "torchaudio",  # PyTorch ecosystem
-            "opencv-python", "pillow",  # Computer vision
-            "librosa", "soundfile",  # Audio processing
-            "pandas", "numpy", "scikit-learn",  # Data science
-            "matplotlib", "seaborn", "plotly",  # Visualization
-            "wandb", "tensorboard"  # MLOps & monitoring
-        ]
-        
         print("\n📦 Installing High Priority Packages...")
-        for package in high_priority:
+        self._install_batch(pip_cmd, HIGH_PRIORITY_PACKAGES)
+        
+        print("\n📦 Installing Medium Priority Packages...")
+        self._install_batch(pip_cmd, MEDIUM_PRIORITY_PACKAGES)
+    
+    def _install_batch(self, pip_cmd, packages):
+        """Install packages with one pip invocation, falling back to one-by-one on failure"""
+        print(f"Installing {', '.join(packages)}...")
+        with tempfile.TemporaryDirectory(prefix="ai-stack-wheels-") as wheel_dir:
+            # pip downloads serially, so fetch the large wheels concurrently first
+            self._prefetch_wheels(pip_cmd, packages, wheel_dir)
             try:
-                print(f"Installing {package}...")
-                result = subprocess.run([pip_cmd, "install", package], 
-                                      capture_output=True, text=True)
-                if result.returncode == 0:
-                    print(f"✅ {package} installed")
-                else:
-                    print(f"⚠️ {package} installation had issues")
+                returncode, output = self._run_pip([pip_cmd, "install", *PIP_FAST_FLAGS,
+                                                    "--find-links", wheel_dir, *packages])
             except Exception as e:
-                print(f"❌ Failed to install {package}: {e}")
+                print(f"❌ Failed to install {', '.join(packages)}: {e}")
+                return
         
-        # Medium priority packages
-        medium_priority = [
-            "tensorflow", "jax", "prometheus", "grafana"
-        ]
+        if returncode == 0:
+            installed = _newly_installed(output)
+            sys.stdout.write("".join(
+                f"✅ {package} installed\n" if normalize_name(package) in installed
+                else f"✅ {package} already satisfied\n"
+                for package in packages
+            ))
+            return
         
-        print("\n📦 Installing Medium Priority Packages...")
-        for package in medium_priority:
+        # The batch failed as a whole; per-package installs show which packages are at fault
+        print("⚠️ Batch install failed, retrying packages individually...")
+        status = []
+        for package in packages:
             try:
-                print(f"Installing {package}...")
-                result = subprocess.run([pip_cmd, "install", package], 
-                                      capture_output=True, text=True)
-                if result.returncode == 0:
-                    print(f"✅ {package} installed")
+                returncode, _ = self._run_pip([pip_cmd, "install", *PIP_FAST_FLAGS, package])
+                if returncode == 0:
+                    status.append(f"✅ {package} installed")
                 else:
-                    print(f"⚠️ {package} installation had issues")
+                    status.append(f"⚠️ {package} installation had issues")
             except Exception as e:
-                print(f"❌ Failed to install {package}: {e}")
+                status.append(f"❌ Failed to install {package}: {e}")
+        sys.stdout.write("\n".join(status) + "\n")
+    
+    def _run_pip(self, cmd):
+        """Run pip, streaming its output and keeping only the lines worth reporting.
+        
+        Returns the exit code and the kept lines (install summaries and errors)
+        rather than buffering pip's full, progress-bar heavy output.
+        """
+        kept = []
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, bufsize=1) as proc:
+            for line in proc.stdout:
+                if line.startswith(("Successfully installed", "ERROR")):
+                    print(f"   {line.rstrip()}")
+                    kept.append(line)
+        return proc.returncode, "".join(kept)
+    
+    def _prefetch_wheels(self, pip_cmd, packages, wheel_dir):
+        """Download the packages' own distributions into wheel_dir in parallel shards"""
+        asyncio.run(self._prefetch_wheels_async(pip_cmd, packages, wheel_dir))
+    
+    async def _prefetch_wheels_async(self, pip_cmd, packages, wheel_dir):
+        shards = [packages[i:i + DOWNLOAD_SHARD_SIZE]
+                  for i in range(0, len(packages), DOWNLOAD_SHARD_SIZE)]
+        semaphore = asyncio.Semaphore(DOWNLOAD_WORKERS)
+        
+        async def download(shard):
+            # Dependencies are resolved by the install step; failures here only cost the speedup
+            async with semaphore:
+                try:
+                    proc = await asyncio.create_subprocess_exec(
+                        pip_cmd, "download", *PIP_FAST_FLAGS, "--no-deps", "--dest", wheel_dir, *shard,
+                        stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
+                    )
+                    await proc.wait()
+                except OSError:
+                    pass
+        
+        await asyncio.gather(*(download(shard) for shard in shards))
     
     def create_coverage_report(self):
         """Create a comprehensive coverage report"""
@@ -186,9 +263,7 @@ class EnhancedAIStackIntegrator:
         
         # Save coverage report
         report_file = self.ai_stack_dir / "coverage_report.json"
-        import json
-        with open(report_file, 'w') as f:
-            json.dump(coverage_report, f, indent=2)
+        report_file.write_bytes(dump_json(coverage_report, pretty=True))
         
         print(f"✅ Coverage report saved to {report_file}")
         return coverage_report
@@ -6,101 +6,31 @@ Integrates comprehensive AI tools and frameworks into AIOS project
 
 import subprocess
 import os
+import shutil
 import sys
 import json
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+from ai_stack_repos import REPOSITORIES
+
+# System packages the stack needs; the minimal set covers everything Part 2 uses
+# (git for clones, venv for packages, a compiler for sdists, curl for the Ollama
+# installer), so Part 2 can run alongside the rest
+SYSTEM_DEPENDENCIES = (
+    "git", "docker.io", "nodejs", "npm", "golang-go", "python3-pip",
+    "python3-venv", "build-essential", "curl", "wget"
+)
+MINIMAL_DEPENDENCIES = ("git", "python3-venv", "curl", "build-essential")
+
+# One directory per repository type, in first-seen order
+REPO_TYPES = tuple(dict.fromkeys(repo.type for repo in REPOSITORIES))
+
 class AIStackIntegrator:
     def __init__(self):
         self.project_root = Path("/home/booze/ai-development")
         self.ai_stack_dir = self.project_root / "ai-stack"
-        self.repositories = {
-            "parrotos-practical-guide": {
-                "url": "https://github.com/HassanNetSec/parrotos-practical-guide.git",
-                "description": "Parrot OS cybersecurity and ethical hacking guide",
-                "type": "guide",
-                "install_method": "clone_only"
-            },
-            "aiostreams": {
-                "url": "https://github.com/Viren070/AIOStreams.git",
-                "description": "Stremio super-addon for streaming aggregation",
-                "type": "media",
-                "install_method": "docker"
-            },
-            "system-prompts-and-models": {
-                "url": "https://github.com/x1xhlol/system-prompts-and-models-of-ai-tools.git",
-                "description": "20,000+ lines of system prompts and AI models",
-                "type": "ai_resources",
-                "install_method": "clone_only"
-            },
-            "db-gpt": {
-                "url": "https://github.com/eosphoros-ai/DB-GPT.git",
-                "description": "AI-native framework for data app development",
-                "type": "ai_framework",
-                "install_method": "pip_install"
-            },
-            "yao": {
-                "url": "https://github.com/YaoApp/yao.git",
-                "description": "All-in-one engine for building web apps with AI",
-                "type": "web_framework",
-                "install_method": "binary_download"
-            },
-            "promptic": {
-                "url": "https://github.com/knowsuchagency/promptic.git",
-                "description": "Python library for LLM app development",
-                "type": "ai_library",
-                "install_method": "pip_install"
-            },
-            "next-money": {
-                "url": "https://github.com/virgoone/next-money.git",
-                "description": "Flux AI image generator SaaS starter",
-                "type": "web_app",
-                "install_method": "node_install"
-            },
-            "transformers": {
-                "url": "https://github.com/huggingface/transformers.git",
-                "description": "Core library for NLP and multimodal models",
-                "type": "ai_library",
-                "install_method": "pip_install"
-            },
-            "langchain": {
-                "url": "https://github.com/langchain-ai/langchain.git",
-                "description": "Framework for building LLM apps with chains and agents",
-                "type": "ai_framework",
-                "install_method": "pip_install"
-            },
-            "autogen": {
-                "url": "https://github.com/microsoft/autogen.git",
-                "description": "Multi-agent framework for conversational AI",
-                "type": "ai_framework",
-                "install_method": "pip_install"
-            },
-            "deepspeed": {
-                "url": "https://github.com/microsoft/DeepSpeed.git",
-                "description": "Optimization library for large model training",
-                "type": "ai_library",
-                "install_method": "pip_install"
-            },
-            "dvc": {
-                "url": "https://github.com/iterative/dvc.git",
-                "description": "Data version control for datasets and pipelines",
-                "type": "data_tools",
-                "install_method": "pip_install"
-            },
-            "mlflow": {
-                "url": "https://github.com/mlflow/mlflow.git",
-                "description": "MLOps platform for experiment tracking and deployment",
-                "type": "mlops",
-                "install_method": "pip_install"
-            },
-            "bentoml": {
-                "url": "https://github.com/bentoml/BentoML.git",
-                "description": "Packaging and deploying models as APIs/microservices",
-                "type": "deployment",
-                "install_method": "pip_install"
-            }
-        }
+        self.repositories = REPOSITORIES
         
     def setup_environment(self):
         """Set up the AI stack environment"""
@@ -111,41 +41,80 @@ class AIStackIntegrator:
         print(f"✅ Created AI stack directory: {self.ai_stack_dir}")
         
         # Create subdirectories for different types
-        for repo_type in ["ai_framework", "ai_library", "data_tools", "mlops", "deployment", "web_framework", "web_app", "ai_resources", "guide", "media"]:
+        for repo_type in REPO_TYPES:
             (self.ai_stack_dir / repo_type).mkdir(exist_ok=True)
         
         print("✅ Created organized directory structure")
         
-    def install_system_dependencies(self):
+    def install_system_dependencies(self, dependencies=SYSTEM_DEPENDENCIES):
         """Install system-level dependencies"""
         print("\n🔧 Installing system dependencies...")
         
-        dependencies = [
-            "git", "docker.io", "nodejs", "npm", "golang-go", "python3-pip",
-            "python3-venv", "build-essential", "curl", "wget"
-        ]
-        
+        # Query dpkg once and only hand apt the packages that are actually missing
+        installed = self._installed_system_packages()
+        missing = []
         for dep in dependencies:
-            try:
-                print(f"Installing {dep}...")
-                result = subprocess.run(["sudo", "apt", "install", "-y", dep], 
-                                      capture_output=True, text=True)
-                if result.returncode == 0:
-                    print(f"✅ {dep} installed")
-                else:
-                    print(f"⚠️ {dep} installation had issues")
-            except Exception as e:
-                print(f"❌ Failed to install {dep}: {e}")
+            if dep in installed:
+                print(f"✅ {dep} already installed")
+            else:
+                missing.append(dep)
+        if missing:
+            self._apt_install(missing)
+        
+        if "docker.io" not in dependencies:
+            return
         
-        # Start Docker service
+        # Start and enable Docker service in one sudo invocation
         try:
-            subprocess.run(["sudo", "systemctl", "start", "docker"], 
-                          capture_output=True, text=True)
-            subprocess.run(["sudo", "systemctl", "enable", "docker"], 
-                          capture_output=True, text=True)
+            subprocess.run(["sudo", "systemctl", "enable", "--now", "docker"], 
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             print("✅ Docker service started and enabled")
         except Exception as e:
             print(f"⚠️ Docker service setup had issues: {e}")
+    
+    def _installed_system_packages(self):
+        """Names of the packages dpkg reports as installed"""
+        try:
+            output = subprocess.run(["dpkg-query", "-W", "-f=${Package}\t${db:Status-Abbrev}\n"],
+                                  stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True).stdout
+        except OSError:
+            return set()
+        return {name for name, _, status in (line.partition("\t") for line in output.splitlines())
+                if status.startswith("ii")}
+    
+    def _apt_install(self, dependencies):
+        """Install packages with apt-get"""
+        # sudo resets the environment, so pass the frontend through env(1)
+        apt_cmd = ["sudo", "env", "DEBIAN_FRONTEND=noninteractive"]
+        
+        # eatmydata turns dpkg's per-file fsync into a no-op. A crash mid-install can
+        # then leave a corrupt package database, so only use it on throwaway hosts
+        # (CI, containers) or when AI_STACK_EATMYDATA=1 is set explicitly.
+        if os.environ.get("CI") or os.environ.get("AI_STACK_EATMYDATA") == "1":
+            if shutil.which("eatmydata") is None:
+                subprocess.run([*apt_cmd, "apt-get", "install", "-y", "eatmydata"],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if shutil.which("eatmydata") is not None:
+                apt_cmd.append("eatmydata")
+                print("⚡ Using eatmydata to skip fsync during package installs")
+        
+        # One transaction: the solver runs once and dpkg triggers fire once at the end
+        try:
+            print(f"Installing {', '.join(dependencies)}...")
+            result = subprocess.run([*apt_cmd, "apt-get", "install", "-y", "--no-install-recommends", *dependencies],
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+            if result.returncode == 0:
+                for dep in dependencies:
+                    print(f"✅ {dep} installed")
+            else:
+                # apt aborts the whole transaction, so name the packages it rejected
+                for dep in dependencies:
+                    if f"Unable to locate package {dep}" in result.stderr:
+                        print(f"❌ {dep} not found")
+                    else:
+                        print(f"⚠️ {dep} installation had issues")
+        except Exception as e:
+            print(f"❌ Failed to install system dependencies: {e}")
 
 # Main execution for Part 1
 if __name__ == "__main__":
@@ -154,9 +123,19 @@ if __name__ == "__main__":
     
     integrator = AIStackIntegrator()
     
-    # Run Part 1 setup
-    integrator.setup_environment()
-    integrator.install_system_dependencies()
+    # "minimal" installs just what Part 2 needs, so the master script can overlap
+    # the "rest" with repository cloning; no argument runs everything
+    stage = sys.argv[1] if len(sys.argv) > 1 else "all"
+    if stage in ("minimal", "all"):
+        integrator.setup_environment()
+    if stage == "minimal":
+        integrator.install_system_dependencies(MINIMAL_DEPENDENCIES)
+    elif stage == "rest":
+        integrator.install_system_dependencies(
+            tuple(dep for dep in SYSTEM_DEPENDENCIES if dep not in MINIMAL_DEPENDENCIES)
+        )
+    else:
+        integrator.install_system_dependencies()
     
     print("\n✅ Part 1 Complete: Environment and Dependencies")
     print("🚀 Ready for Part 2: Repository Cloning")
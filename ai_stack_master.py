@@ -6,16 +6,22 @@ Runs all parts of the AI stack integration
 
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def run_part(part_name, script_path):
+def run_part(part_name, script_path, *args):
     """Run a specific part of the integration"""
     print(f"\n🚀 Running {part_name}...")
     print("=" * 50)
     
+    if not script_path.exists():
+        print(f"⚠️ {part_name} script not found: {script_path}")
+        return False
+    
     try:
-        result = subprocess.run([sys.executable, str(script_path)], 
-                              capture_output=True, text=True)
+        # Only stderr is reported, so don't buffer the part's progress output
+        result = subprocess.run([sys.executable, str(script_path), *args],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         
         if result.returncode == 0:
             print(f"✅ {part_name} completed successfully")
@@ -23,7 +29,7 @@ def run_part(part_name, script_path):
         else:
             print(f"❌ {part_name} failed: {result.stderr}")
             return False
-            
+    
     except Exception as e:
         print(f"❌ Error running {part_name}: {e}")
         return False
@@ -37,27 +43,32 @@ def main():
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
     
-    # Define parts
-    parts = [
-        ("Part 1: Environment Setup", project_root / "ai_stack_integration.py"),
-        ("Part 2: Repository Cloning", project_root / "ai_stack_part2.py"),
-        ("Part 3: Integration Configuration", project_root / "ai_stack_part3.py")
-    ]
-    
-    # Run each part
+    part1 = project_root / "ai_stack_integration.py"
+    part2 = project_root / "ai_stack_part2.py"
+    part3 = project_root / "ai_stack_part3.py"
+    total_parts = 3
     success_count = 0
-    for part_name, script_path in parts:
-        if script_path.exists():
-            if run_part(part_name, script_path):
-                success_count += 1
-        else:
-            print(f"⚠️ {part_name} script not found: {script_path}")
+    
+    # Part 2 only needs Part 1's minimal packages (git, venv, compiler, curl), so install
+    # those first and clone while the remaining system packages install; both finish
+    # before Part 3
+    part1_ok = run_part("Part 1: Environment Setup (prerequisites)", part1, "minimal")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        part1_rest = executor.submit(run_part, "Part 1: Environment Setup (system packages)", part1, "rest")
+        part2_done = executor.submit(run_part, "Part 2: Repository Cloning", part2)
+        if part1_ok and part1_rest.result():
+            success_count += 1
+        if part2_done.result():
+            success_count += 1
+    
+    if run_part("Part 3: Integration Configuration", part3):
+        success_count += 1
     
     # Summary
     print("\n" + "=" * 50)
-    print(f"🎯 Integration Summary: {success_count}/{len(parts)} parts completed")
+    print(f"🎯 Integration Summary: {success_count}/{total_parts} parts completed")
     
-    if success_count == len(parts):
+    if success_count == total_parts:
         print("🎉 All parts completed successfully!")
         print("🚀 Your AI Development Stack is ready!")
         print("\nNext steps:")
@@ -66,6 +77,8 @@ def main():
     else:
         print("⚠️ Some parts failed. Check the logs above.")
         print("💡 You can run individual parts manually.")
+    
+    return success_count == total_parts
 
 if __name__ == "__main__":
-    main()
+    sys.exit(0 if main() else 1)
@@ -4,10 +4,48 @@ AI Development Stack Integration Script - Part 2
 Repository cloning and Python package installation
 """
 
+import importlib.metadata
+import os
+import shutil
+import stat
 import subprocess
 import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from ai_stack_common import normalize_name
+from ai_stack_repos import REPOSITORIES
+
+# Clones are network-bound, so threads overlap them despite the GIL
+MAX_CLONE_WORKERS = 8
+
+# Repository types cloned purely as reference; history is never used, so clone shallow
+SHALLOW_CLONE_TYPES = frozenset({"ai_framework", "ai_library", "mlops", "deployment"})
+
+# Protocol v2 skips the full ref advertisement; submodules and multi-remote
+# fetches run 8 at a time
+GIT_CMD = ("git", "-c", "protocol.version=2", "-c", "fetch.parallel=8",
+           "-c", "submodule.fetchJobs=8")
+
+YAO_BINARY_URL = "https://github.com/YaoApp/yao/releases/latest/download/yao"
+
+OLLAMA_INSTALL_URL = "https://ollama.com/install.sh"
+
+# Ollama's HTTP API; answering here means the daemon is ready for pulls
+OLLAMA_URL = "http://127.0.0.1:11434/"
+OLLAMA_START_TIMEOUT = 30
+
+# Keeps status lines from concurrent clones from interleaving
+_print_lock = threading.Lock()
+
+def _log(message):
+    """Print a status line without interleaving with other worker threads"""
+    with _print_lock:
+        print(message)
+
 class AIStackPart2:
     def __init__(self):
         self.project_root = Path("/home/booze/ai-development")
@@ -17,86 +55,40 @@ class AIStackPart2:
         """Clone all AI development repositories"""
         print("\n📥 Cloning AI development repositories...")
         
-        repositories = {
-            "parrotos-practical-guide": {
-                "url": "https://github.com/HassanNetSec/parrotos-practical-guide.git",
-                "type": "guide"
-            },
-            "aiostreams": {
-                "url": "https://github.com/Viren070/AIOStreams.git",
-                "type": "media"
-            },
-            "system-prompts-and-models": {
-                "url": "https://github.com/x1xhlol/system-prompts-and-models-of-ai-tools.git",
-                "type": "ai_resources"
-            },
-            "db-gpt": {
-                "url": "https://github.com/eosphoros-ai/DB-GPT.git",
-                "type": "ai_framework"
-            },
-            "yao": {
-                "url": "https://github.com/YaoApp/yao.git",
-                "type": "web_framework"
-            },
-            "promptic": {
-                "url": "https://github.com/knowsuchagency/promptic.git",
-                "type": "ai_library"
-            },
-            "next-money": {
-                "url": "https://github.com/virgoone/next-money.git",
-                "type": "web_app"
-            },
-            "transformers": {
-                "url": "https://github.com/huggingface/transformers.git",
-                "type": "ai_library"
-            },
-            "langchain": {
-                "url": "https://github.com/langchain-ai/langchain.git",
-                "type": "ai_framework"
-            },
-            "autogen": {
-                "url": "https://github.com/microsoft/autogen.git",
-                "type": "ai_framework"
-            },
-            "deepspeed": {
-                "url": "https://github.com/microsoft/DeepSpeed.git",
-                "type": "ai_library"
-            },
-            "dvc": {
-                "url": "https://github.com/iterative/dvc.git",
-                "type": "data_tools"
-            },
-            "mlflow": {
-                "url": "https://github.com/mlflow/mlflow.git",
-                "type": "mlops"
-            },
-            "bentoml": {
-                "url": "https://github.com/bentoml/BentoML.git",
-                "type": "deployment"
-            }
-        }
-        
-        for repo_name, repo_info in repositories.items():
-            try:
-                repo_type = repo_info["type"]
-                repo_url = repo_info["url"]
-                target_dir = self.ai_stack_dir / repo_type / repo_name
-                
-                if target_dir.exists():
-                    print(f"⚠️ {repo_name} already exists, skipping...")
-                    continue
-                
-                print(f"Cloning {repo_name}...")
-                result = subprocess.run(["git", "clone", repo_url, str(target_dir)], 
-                                      capture_output=True, text=True)
+        with ThreadPoolExecutor(max_workers=MAX_CLONE_WORKERS) as executor:
+            list(executor.map(self._clone_one, REPOSITORIES))
+    
+    def _clone_one(self, repo):
+        """Clone a single repository; safe to run from a worker thread"""
+        repo_name = repo.name
+        try:
+            repo_type = repo.type
+            repo_url = repo.url
+            target_dir = self.ai_stack_dir / repo_type / repo_name
+            
+            if target_dir.exists():
+                _log(f"⚠️ {repo_name} already exists, skipping...")
+                return
+            
+            clone_cmd = [*GIT_CMD, "clone", "--recurse-submodules"]
+            clone_depth = repo.clone_depth
+            if clone_depth is None and repo_type in SHALLOW_CLONE_TYPES:
+                clone_depth = 1
+            if clone_depth is not None:
+                clone_cmd += [f"--depth={clone_depth}", "--single-branch", "--filter=blob:none",
+                              "--shallow-submodules"]
+            
+            _log(f"Cloning {repo_name}...")
+            result = subprocess.run([*clone_cmd, repo_url, str(target_dir)],
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+            
+            if result.returncode == 0:
+                _log(f"✅ {repo_name} cloned to {target_dir}")
+            else:
+                _log(f"❌ Failed to clone {repo_name}: {result.stderr}")
                 
-                if result.returncode == 0:
-                    print(f"✅ {repo_name} cloned to {target_dir}")
-                else:
-                    print(f"❌ Failed to clone {repo_name}: {result.stderr}")
-                    
-            except Exception as e:
-                print(f"❌ Error cloning {repo_name}: {e}")
+        except Exception as e:
+            _log(f"❌ Error cloning {repo_name}: {e}")
     
     def install_python_packages(self):
         """Install Python packages"""
@@ -116,11 +108,41 @@ class AIStackPart2:
             "deepspeed", "dvc", "mlflow", "bentoml"
         ]
         
+        # Read the venv's installed distributions in-process and only install the rest
+        installed = self._installed_python_packages(venv_path)
+        for package in python_packages:
+            if normalize_name(package) in installed:
+                print(f"✅ {package} already installed")
+        python_packages = [package for package in python_packages if normalize_name(package) not in installed]
+        if not python_packages:
+            return
+        
+        # One resolver run for the whole set; uv resolves and downloads in parallel
+        uv_cmd = shutil.which("uv")
+        if uv_cmd:
+            install_cmd = [uv_cmd, "pip", "install", "--python", str(venv_path / "bin" / "python")]
+        else:
+            install_cmd = [pip_cmd, "install"]
+        
+        try:
+            print(f"Installing {', '.join(python_packages)}...")
+            result = subprocess.run([*install_cmd, *python_packages], 
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+            if result.returncode == 0:
+                for package in python_packages:
+                    print(f"✅ {package} installed")
+                return
+        except Exception as e:
+            print(f"❌ Failed to install {', '.join(python_packages)}: {e}")
+            return
+        
+        # pip installs all or nothing, so go package by package to keep the ones that work
+        print("⚠️ Batch install failed, retrying packages individually...")
         for package in python_packages:
             try:
                 print(f"Installing {package}...")
-                result = subprocess.run([pip_cmd, "install", package], 
-                                      capture_output=True, text=True)
+                result = subprocess.run([*install_cmd, package], 
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
                 if result.returncode == 0:
                     print(f"✅ {package} installed")
                 else:
@@ -128,21 +150,34 @@ class AIStackPart2:
             except Exception as e:
                 print(f"❌ Failed to install {package}: {e}")
     
+    def _installed_python_packages(self, venv_path):
+        """Normalized names of the distributions installed in the venv"""
+        site_packages = [str(path) for path in venv_path.glob("lib/python*/site-packages")]
+        if not site_packages:
+            return set()
+        return {normalize_name(dist.metadata["Name"])
+                for dist in importlib.metadata.distributions(path=site_packages)
+                if dist.metadata["Name"]}
+    
     def download_binaries(self):
         """Download binary executables"""
         print("\n📦 Downloading binary executables...")
         
         # Download Yao binary
+        yao_path = self.ai_stack_dir / "binaries" / "yao"
+        part_path = yao_path.with_suffix(".part")
         try:
-            yao_path = self.ai_stack_dir / "binaries" / "yao"
             yao_path.parent.mkdir(exist_ok=True)
             
             print("Downloading Yao binary...")
-            subprocess.run(["wget", "-O", str(yao_path), 
-                          "https://github.com/YaoApp/yao/releases/latest/download/yao"])
-            subprocess.run(["chmod", "+x", str(yao_path)])
+            # Stream straight to disk in 1 MiB chunks; rename only once complete
+            with urllib.request.urlopen(YAO_BINARY_URL, timeout=30) as resp, open(part_path, "wb") as f:
+                shutil.copyfileobj(resp, f, length=1 << 20)
+            os.replace(part_path, yao_path)
+            os.chmod(yao_path, os.stat(yao_path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
             print("✅ Yao binary downloaded and made executable")
         except Exception as e:
+            part_path.unlink(missing_ok=True)
             print(f"❌ Failed to download Yao: {e}")
     
     def setup_ollama(self):
@@ -150,28 +185,52 @@ class AIStackPart2:
         print("\n🤖 Setting up Ollama...")
         
         try:
-            # Install Ollama
-            subprocess.run(["curl", "-fsSL", "https://ollama.com/install.sh", "|", "sh"], 
-                          shell=True)
-            print("✅ Ollama installed")
+            # Install Ollama, feeding the installer script straight to sh
+            if shutil.which("ollama"):
+                print("✅ Ollama already installed")
+            else:
+                with urllib.request.urlopen(OLLAMA_INSTALL_URL, timeout=30) as resp:
+                    installer = resp.read()
+                if subprocess.run(["sh"], input=installer).returncode != 0:
+                    print("❌ Ollama installer failed")
+                    return
+                print("✅ Ollama installed")
             
-            # Start Ollama service
-            subprocess.run(["ollama", "serve"], background=True)
+            # Start Ollama service detached, unless a daemon is already running
+            if not self._ollama_ready(timeout=0):
+                subprocess.Popen(["ollama", "serve"], stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL, start_new_session=True)
+            if not self._ollama_ready(timeout=OLLAMA_START_TIMEOUT):
+                print("❌ Ollama service did not come up, skipping model pulls")
+                return
             print("✅ Ollama service started")
             
-            # Pull basic models
+            # Pull basic models concurrently; each is a multi-GB network download
             models = ["llama3", "mistral", "codellama"]
-            for model in models:
-                try:
-                    print(f"Pulling {model} model...")
-                    subprocess.run(["ollama", "pull", model], 
-                                  capture_output=True, text=True)
+            print(f"Pulling {', '.join(models)} models...")
+            pulls = {model: subprocess.Popen(["ollama", "pull", model],
+                                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                     for model in models}
+            for model, proc in pulls.items():
+                if proc.wait() == 0:
                     print(f"✅ {model} model pulled")
-                except Exception as e:
-                    print(f"⚠️ Failed to pull {model}: {e}")
+                else:
+                    print(f"⚠️ Failed to pull {model}")
                     
         except Exception as e:
             print(f"❌ Ollama setup failed: {e}")
+    
+    def _ollama_ready(self, timeout):
+        """Wait up to timeout seconds for the Ollama daemon to answer"""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                with urllib.request.urlopen(OLLAMA_URL, timeout=2):
+                    return True
+            except OSError:
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(0.5)
 
 # Main execution for Part 2
 if __name__ == "__main__":
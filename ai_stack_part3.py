@@ -4,65 +4,63 @@ AI Development Stack Integration Script - Part 3
 Integration configuration and usage examples
 """
 
-import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-class AIStackPart3:
+from ai_stack_common import dump_json
+
+def _write_file(path, chunks):
+    """Write a whole file from its chunks with one vectored write on a raw descriptor"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        written = os.writev(fd, chunks)
+        if written < sum(map(len, chunks)):
+            # Short write: fall back to plain writes for whatever is left
+            rest = memoryview(b"".join(chunks))[written:]
+            while rest:
+                rest = rest[os.write(fd, rest):]
+    finally:
+        os.close(fd)
+
+# AIOS imports and agent base class shared by every usage example
+_EXAMPLE_PREAMBLE = b"""
+from aios.object import Object
+from aios.state import State
+
+class AIOSExampleAgent:
+    \"\"\"AIOS object with an idle/working/done status\"\"\"
     def __init__(self):
-        self.project_root = Path("/home/booze/ai-development")
-        self.ai_stack_dir = self.project_root / "ai-stack"
-        
-    def create_integration_config(self):
-        """Create integration configuration files"""
-        print("\n⚙️ Creating integration configuration...")
-        
-        # Create main configuration
-        config = {
-            "ai_stack": {
-                "version": "1.0",
-                "description": "Comprehensive AI Development Stack",
-                "integration": {
-                    "aios": {
-                        "enabled": True,
-                        "path": str(self.project_root / "environments" / "aios-env"),
-                        "integration_type": "core_orchestration"
-                    },
-                    "crewai": {
-                        "enabled": True,
-                        "integration_type": "agent_orchestration"
-                    },
-                    "ollama": {
-                        "enabled": True,
-                        "host": "http://localhost:11434",
-                        "integration_type": "local_llm"
-                    }
-                }
-            }
-        }
-        
-        config_file = self.ai_stack_dir / "ai_stack_config.json"
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
-        
-        print(f"✅ Configuration saved to {config_file}")
-        
-        # Create integration script
-        integration_script = self.ai_stack_dir / "integrate_with_aios.py"
-        with open(integration_script, 'w') as f:
-            f.write(self._generate_integration_script())
-        
-        print(f"✅ Integration script created: {integration_script}")
-    
-    def _generate_integration_script(self):
-        """Generate the AIOS integration script"""
-        return '''#!/usr/bin/env python3
+        self.agent = Object()
+        self.status = State(['idle', 'working', 'done'], name='status', default='idle')
+"""
+
+def _example_chunks(source):
+    """Encode a usage example as (header, preamble, body) chunks, splicing the
+    shared preamble in after its docstring"""
+    data = source.encode()
+    end = data.index(b'"""', data.index(b'"""') + 3) + len(b'"""\n')
+    return data[:end], _EXAMPLE_PREAMBLE, data[end:]
+
+def _emit(lines):
+    """Write a method's status lines to stdout in one write"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+# Generated files are fixed text, so encode them once at import
+
+# AIOS integration script
+_INTEGRATION_SCRIPT = '''#!/usr/bin/env python3
 """
 AIOS Integration Script
 Integrates all AI stack components with AIOS
 """
 
+import importlib.util
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add AI stack to Python path
@@ -91,11 +89,22 @@ def integrate_components():
         ("BentoML", "bentoml")
     ]
     
-    for name, module in integrations:
+    def probe(module):
+        # find_spec only locates the package and runs none of its code, so the probes
+        # can't interfere with each other the way concurrent imports can
         try:
-            __import__(module)
+            return importlib.util.find_spec(module) is not None
+        except (ImportError, ValueError):
+            return False
+    
+    # Look each component up in its own thread so the path scans overlap;
+    # results are still reported in the order above
+    with ThreadPoolExecutor(max_workers=len(integrations)) as executor:
+        available = list(executor.map(probe, [module for _, module in integrations]))
+    for (name, _), ok in zip(integrations, available):
+        if ok:
             print(f"✅ {name} integration successful")
-        except ImportError:
+        else:
             print(f"⚠️ {name} not available")
     
     print("🎉 AI Stack integration complete!")
@@ -103,49 +112,23 @@ def integrate_components():
 
 if __name__ == "__main__":
     integrate_components()
-'''
-    
-    def create_usage_examples(self):
-        """Create usage examples and documentation"""
-        print("\n📚 Creating usage examples...")
-        
-        examples_dir = self.ai_stack_dir / "examples"
-        examples_dir.mkdir(exist_ok=True)
-        
-        # Create basic usage examples
-        examples = {
-            "aios_langchain_integration.py": self._create_langchain_example(),
-            "aios_autogen_integration.py": self._create_autogen_example(),
-            "aios_transformers_integration.py": self._create_transformers_example(),
-            "aios_db_gpt_integration.py": self._create_db_gpt_example()
-        }
-        
-        for filename, content in examples.items():
-            example_file = examples_dir / filename
-            with open(example_file, 'w') as f:
-                f.write(content)
-            print(f"✅ Created example: {filename}")
-    
-    def _create_langchain_example(self):
-        """Create LangChain integration example"""
-        return '''#!/usr/bin/env python3
+'''.encode()
+
+# LangChain integration example
+_LANGCHAIN_EXAMPLE = _example_chunks('''#!/usr/bin/env python3
 """
 AIOS + LangChain Integration Example
 Shows how to use LangChain with AIOS agents
 """
 
-from aios.object import Object
-from aios.state import State
-
 try:
     from langchain.agents import initialize_agent, AgentType
     from langchain.llms import Ollama
     from langchain.tools import Tool
     
-    class AIOSLangChainAgent:
+    class AIOSLangChainAgent(AIOSExampleAgent):
         def __init__(self):
-            self.agent = Object()
-            self.status = State(['idle', 'working', 'done'], name='status', default='idle')
+            super().__init__()
             self.llm = Ollama(model="llama3")
             
         def create_tools(self):
@@ -179,27 +162,19 @@ try:
         
 except ImportError:
     print("LangChain not available. Install with: pip install langchain")
-'''
-    
-    def _create_autogen_example(self):
-        """Create AutoGen integration example"""
-        return '''#!/usr/bin/env python3
+''')
+
+# AutoGen integration example
+_AUTOGEN_EXAMPLE = _example_chunks('''#!/usr/bin/env python3
 """
 AIOS + AutoGen Integration Example
 Shows how to use AutoGen with AIOS agents
 """
 
-from aios.object import Object
-from aios.state import State
-
 try:
     import autogen
     
-    class AIOSAutoGenAgent:
-        def __init__(self):
-            self.agent = Object()
-            self.status = State(['idle', 'working', 'done'], name='status', default='idle')
-            
+    class AIOSAutoGenAgent(AIOSExampleAgent):
         def create_autogen_agents(self):
             """Create AutoGen agents"""
             config_list = [
@@ -253,27 +228,19 @@ try:
         
 except ImportError:
     print("AutoGen not available. Install with: pip install pyautogen")
-'''
-    
-    def _create_transformers_example(self):
-        """Create Transformers integration example"""
-        return '''#!/usr/bin/env python3
+''')
+
+# Transformers integration example
+_TRANSFORMERS_EXAMPLE = _example_chunks('''#!/usr/bin/env python3
 """
 AIOS + Transformers Integration Example
 Shows how to use Transformers with AIOS agents
 """
 
-from aios.object import Object
-from aios.state import State
-
 try:
     from transformers import pipeline, AutoTokenizer, AutoModelForCausalLM
     
-    class AIOSTransformersAgent:
-        def __init__(self):
-            self.agent = Object()
-            self.status = State(['idle', 'working', 'done'], name='status', default='idle')
-            
+    class AIOSTransformersAgent(AIOSExampleAgent):
         def load_model(self, model_name="microsoft/DialoGPT-medium"):
             """Load a Transformers model"""
             try:
@@ -324,27 +291,19 @@ try:
         
 except ImportError:
     print("Transformers not available. Install with: pip install transformers")
-'''
-    
-    def _create_db_gpt_example(self):
-        """Create DB-GPT integration example"""
-        return '''#!/usr/bin/env python3
+''')
+
+# DB-GPT integration example
+_DB_GPT_EXAMPLE = _example_chunks('''#!/usr/bin/env python3
 """
 AIOS + DB-GPT Integration Example
 Shows how to use DB-GPT with AIOS agents
 """
 
-from aios.object import Object
-from aios.state import State
-
 try:
     from dbgpt import DBGPT
     
-    class AIOSDBGPTAgent:
-        def __init__(self):
-            self.agent = Object()
-            self.status = State(['idle', 'working', 'done'], name='status', default='idle')
-            
+    class AIOSDBGPTAgent(AIOSExampleAgent):
         def connect_to_db_gpt(self, host="localhost", port=5000):
             """Connect to DB-GPT instance"""
             try:
@@ -382,46 +341,65 @@ try:
         
 except ImportError:
     print("DB-GPT not available. Install with: pip install db-gpt")
-'''
-    
-    def create_master_script(self):
-        """Create master script to run all parts"""
-        print("\n🎯 Creating master integration script...")
-        
-        master_script = self.ai_stack_dir / "run_full_integration.py"
-        with open(master_script, 'w') as f:
-            f.write(self._generate_master_script())
-        
-        print(f"✅ Master script created: {master_script}")
-    
-    def _generate_master_script(self):
-        """Generate the master integration script"""
-        return '''#!/usr/bin/env python3
+''')
+
+# Master integration script
+_MASTER_SCRIPT = '''#!/usr/bin/env python3
 """
 Master AI Stack Integration Script
 Runs all parts of the AI stack integration
 """
 
-import subprocess
+import os
+import runpy
 import sys
+import tempfile
+from multiprocessing import Pool
 from pathlib import Path
 
-def run_part(part_name, script_path):
+def run_part(part_name, script_path, isolated=False, *args):
     """Run a specific part of the integration"""
     print(f"\\n🚀 Running {part_name}...")
     print("=" * 50)
     
+    if not script_path.exists():
+        print(f"⚠️ {part_name} script not found: {script_path}")
+        return False
+    
     try:
-        result = subprocess.run([sys.executable, str(script_path)], 
-                              capture_output=True, text=True)
+        if isolated:
+            # Spawn the interpreter directly; stderr goes to a scratch file that is
+            # only read back on failure, stdout is discarded as before
+            with tempfile.TemporaryFile() as err:
+                pid = os.posix_spawn(sys.executable, [sys.executable, str(script_path), *args], os.environ,
+                                     file_actions=[(os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                                                   (os.POSIX_SPAWN_DUP2, err.fileno(), 2)])
+                _, status = os.waitpid(pid, 0)
+                
+                if os.waitstatus_to_exitcode(status) == 0:
+                    print(f"✅ {part_name} completed successfully")
+                    return True
+                else:
+                    err.seek(0)
+                    print(f"❌ {part_name} failed: {err.read().decode(errors='replace')}")
+                    return False
+        
+        # Run in this interpreter: no startup cost, and imports stay cached between parts
+        saved_argv, saved_path = sys.argv, sys.path[:]
+        sys.argv = [str(script_path), *args]
+        sys.path.insert(0, str(script_path.parent))
+        try:
+            runpy.run_path(str(script_path), run_name="__main__")
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                print(f"❌ {part_name} failed: exit status {e.code}")
+                return False
+        finally:
+            sys.argv, sys.path[:] = saved_argv, saved_path
+        
+        print(f"✅ {part_name} completed successfully")
+        return True
         
-        if result.returncode == 0:
-            print(f"✅ {part_name} completed successfully")
-            return True
-        else:
-            print(f"❌ {part_name} failed: {result.stderr}")
-            return False
-            
     except Exception as e:
         print(f"❌ Error running {part_name}: {e}")
         return False
@@ -435,27 +413,39 @@ def main():
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
     
-    # Define parts
-    parts = [
-        ("Part 1: Environment Setup", project_root / "ai_stack_integration.py"),
-        ("Part 2: Repository Cloning", project_root / "ai_stack_part2.py"),
-        ("Part 3: Integration Configuration", project_root / "ai_stack_part3.py")
+    part1 = project_root / "ai_stack_integration.py"
+    part2 = project_root / "ai_stack_part2.py"
+    part3 = project_root / "ai_stack_part3.py"
+    total_parts = 3
+    
+    # --isolated runs each part in its own interpreter instead
+    isolated = "--isolated" in sys.argv[1:]
+    
+    # Part 2 only needs Part 1's minimal packages (git, venv, compiler, curl), so install
+    # those first; the remaining system packages and the clones then run in worker
+    # processes side by side, and Part 3 waits for both
+    part1_ok = run_part("Part 1: Environment Setup (prerequisites)", part1, isolated, "minimal")
+    independent_parts = [
+        ("Part 1: Environment Setup (system packages)", part1, isolated, "rest"),
+        ("Part 2: Repository Cloning", part2, isolated)
+    ]
+    dependent_parts = [
+        ("Part 3: Integration Configuration", part3, isolated)
     ]
     
-    # Run each part
-    success_count = 0
-    for part_name, script_path in parts:
-        if script_path.exists():
-            if run_part(part_name, script_path):
-                success_count += 1
-        else:
-            print(f"⚠️ {part_name} script not found: {script_path}")
+    # Flush first so forked workers don't inherit and repeat buffered output
+    sys.stdout.flush()
+    with Pool(len(independent_parts)) as pool:
+        part1_rest_ok, part2_ok = pool.starmap(run_part, independent_parts)
+    dependent_results = [run_part(*part) for part in dependent_parts]
+    
+    success_count = (part1_ok and part1_rest_ok) + part2_ok + sum(dependent_results)
     
     # Summary
     print("\\n" + "=" * 50)
-    print(f"🎯 Integration Summary: {success_count}/{len(parts)} parts completed")
+    print(f"🎯 Integration Summary: {success_count}/{total_parts} parts completed")
     
-    if success_count == len(parts):
+    if success_count == total_parts:
         print("🎉 All parts completed successfully!")
         print("🚀 Your AI Development Stack is ready!")
         print("\\nNext steps:")
@@ -468,7 +458,109 @@ def main():
 
 if __name__ == "__main__":
     main()
-'''
+'''.encode()
+
+class AIStackPart3:
+    def __init__(self):
+        self.project_root = Path("/home/booze/ai-development")
+        self.ai_stack_dir = self.project_root / "ai-stack"
+        
+    def create_integration_config(self):
+        """Create integration configuration files"""
+        msgs = ["\n⚙️ Creating integration configuration..."]
+        
+        # Create main configuration
+        config = {
+            "ai_stack": {
+                "version": "1.0",
+                "description": "Comprehensive AI Development Stack",
+                "integration": {
+                    "aios": {
+                        "enabled": True,
+                        "path": str(self.project_root / "environments" / "aios-env"),
+                        "integration_type": "core_orchestration"
+                    },
+                    "crewai": {
+                        "enabled": True,
+                        "integration_type": "agent_orchestration"
+                    },
+                    "ollama": {
+                        "enabled": True,
+                        "host": "http://localhost:11434",
+                        "integration_type": "local_llm"
+                    }
+                }
+            }
+        }
+        
+        config_file = self.ai_stack_dir / "ai_stack_config.json"
+        config_file.write_bytes(dump_json(config) + b"\n")
+        
+        msgs.append(f"✅ Configuration saved to {config_file}")
+        
+        # Create integration script
+        integration_script = self.ai_stack_dir / "integrate_with_aios.py"
+        integration_script.write_bytes(self._generate_integration_script())
+        
+        msgs.append(f"✅ Integration script created: {integration_script}")
+        _emit(msgs)
+    
+    def _generate_integration_script(self):
+        """Generate the AIOS integration script"""
+        return _INTEGRATION_SCRIPT
+    
+    def create_usage_examples(self):
+        """Create usage examples and documentation"""
+        msgs = ["\n📚 Creating usage examples..."]
+        
+        examples_dir = self.ai_stack_dir / "examples"
+        examples_dir.mkdir(exist_ok=True)
+        
+        # Create basic usage examples
+        examples = {
+            "aios_langchain_integration.py": self._create_langchain_example(),
+            "aios_autogen_integration.py": self._create_autogen_example(),
+            "aios_transformers_integration.py": self._create_transformers_example(),
+            "aios_db_gpt_integration.py": self._create_db_gpt_example()
+        }
+        
+        # The files are independent, so overlap their open/write/close syscalls
+        with ThreadPoolExecutor(max_workers=len(examples)) as executor:
+            list(executor.map(_write_file, [examples_dir / filename for filename in examples],
+                              examples.values()))
+        
+        msgs += [f"✅ Created example: {filename}" for filename in examples]
+        _emit(msgs)
+    
+    def _create_langchain_example(self):
+        """Create LangChain integration example"""
+        return _LANGCHAIN_EXAMPLE
+    
+    def _create_autogen_example(self):
+        """Create AutoGen integration example"""
+        return _AUTOGEN_EXAMPLE
+    
+    def _create_transformers_example(self):
+        """Create Transformers integration example"""
+        return _TRANSFORMERS_EXAMPLE
+    
+    def _create_db_gpt_example(self):
+        """Create DB-GPT integration example"""
+        return _DB_GPT_EXAMPLE
+    
+    def create_master_script(self):
+        """Create master script to run all parts"""
+        msgs = ["\n🎯 Creating master integration script..."]
+        
+        master_script = self.ai_stack_dir / "run_full_integration.py"
+        master_script.write_bytes(self._generate_master_script())
+        
+        msgs.append(f"✅ Master script created: {master_script}")
+        _emit(msgs)
+    
+    def _generate_master_script(self):
+        """Generate the master integration script"""
+        return _MASTER_SCRIPT
 
 # Main execution for Part 3
 if __name__ == "__main__":
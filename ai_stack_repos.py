@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+AI Development Stack Repositories
+Single source of truth for the repositories the stack integration scripts clone
+"""
+
+from collections import namedtuple
+
+# clone_depth None means "use the default for the repository type"
+RepoSpec = namedtuple("RepoSpec", "name url type install_method description clone_depth",
+                      defaults=(None,))
+
+REPOSITORIES = (
+    RepoSpec("parrotos-practical-guide", "https://github.com/HassanNetSec/parrotos-practical-guide.git",
+             "guide", "clone_only",
+             "Parrot OS cybersecurity and ethical hacking guide",
+             clone_depth=1),
+    RepoSpec("aiostreams", "https://github.com/Viren070/AIOStreams.git",
+             "media", "docker",
+             "Stremio super-addon for streaming aggregation"),
+    RepoSpec("system-prompts-and-models", "https://github.com/x1xhlol/system-prompts-and-models-of-ai-tools.git",
+             "ai_resources", "clone_only",
+             "20,000+ lines of system prompts and AI models",
+             clone_depth=1),
+    RepoSpec("db-gpt", "https://github.com/eosphoros-ai/DB-GPT.git",
+             "ai_framework", "pip_install",
+             "AI-native framework for data app development"),
+    RepoSpec("yao", "https://github.com/YaoApp/yao.git",
+             "web_framework", "binary_download",
+             "All-in-one engine for building web apps with AI"),
+    RepoSpec("promptic", "https://github.com/knowsuchagency/promptic.git",
+             "ai_library", "pip_install",
+             "Python library for LLM app development"),
+    RepoSpec("next-money", "https://github.com/virgoone/next-money.git",
+             "web_app", "node_install",
+             "Flux AI image generator SaaS starter"),
+    RepoSpec("transformers", "https://github.com/huggingface/transformers.git",
+             "ai_library", "pip_install",
+             "Core library for NLP and multimodal models"),
+    RepoSpec("langchain", "https://github.com/langchain-ai/langchain.git",
+             "ai_framework", "pip_install",
+             "Framework for building LLM apps with chains and agents"),
+    RepoSpec("autogen", "https://github.com/microsoft/autogen.git",
+             "ai_framework", "pip_install",
+             "Multi-agent framework for conversational AI"),
+    RepoSpec("deepspeed", "https://github.com/microsoft/DeepSpeed.git",
+             "ai_library", "pip_install",
+             "Optimization library for large model training"),
+    RepoSpec("dvc", "https://github.com/iterative/dvc.git",
+             "data_tools", "pip_install",
+             "Data version control for datasets and pipelines"),
+    RepoSpec("mlflow", "https://github.com/mlflow/mlflow.git",
+             "mlops", "pip_install",
+             "MLOps platform for experiment tracking and deployment"),
+    RepoSpec("bentoml", "https://github.com/bentoml/BentoML.git",
+             "deployment", "pip_install",
+             "Packaging and deploying models as APIs/microservices")
+)
@@ -4,16 +4,155 @@ AIOS Builder Agent
 Automates the complete AIOS system setup using our comprehensive AI stack
 """
 
-from aios.object import Object
-from aios.state import State
+import asyncio
+import functools
 import subprocess
 import os
 import sys
+import signal
 import logging
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from importlib.machinery import PathFinder
 from pathlib import Path
 
+from ai_stack_common import dump_json
+
+# Upper bounds in seconds for subprocesses, so a stalled index or network can't hang
+# the build; pip matches the config's default_timeout, while the stack setup also
+# clones repositories and pulls models
+INSTALL_TIMEOUT = 600
+TEST_TIMEOUT = 60
+SETUP_TIMEOUT = 3600
+
+# A failing stack setup is retried on this many builds, then the build fails until
+# the attempt count is cleared
+MAX_SETUP_ATTEMPTS = 3
+
+# Productivity workflow template; encoded once at import since it is fixed text
+_WORKFLOW_TEMPLATE = '''#!/usr/bin/env python3
+"""
+AIOS Productivity Workflow
+Demonstrates the complete AIOS system with AI stack integration
+"""
+
+from aios.object import Object
+from aios.state import State
+import time
+
+class AIOSProductivityWorkflow:
+    def __init__(self):
+        self.workflow = Object()
+        self.status = State(['planning', 'executing', 'monitoring', 'completed'], 
+                           name='workflow_status', default='planning')
+        self.tasks = []
+        
+    def add_task(self, task_name, task_type, ai_tools=None):
+        task = {
+            'name': task_name,
+            'type': task_type,
+            'status': 'pending',
+            'agent': Object(),
+            'ai_tools': ai_tools or []
+        }
+        self.tasks.append(task)
+        print(f"✅ Task added: {task_name}")
+        
+    def execute_workflow(self):
+        self.status.change_state('executing')
+        print(f"🚀 Executing AIOS workflow with {len(self.tasks)} tasks...")
+        
+        for i, task in enumerate(self.tasks, 1):
+            print(f"📋 Task {i}: {task['name']} ({task['type']})")
+            task['status'] = 'in_progress'
+            
+            # Simulate AI-powered work
+            if task['ai_tools']:
+                print(f"   🤖 Using AI tools: {', '.join(task['ai_tools'])}")
+            
+            time.sleep(0.5)
+            task['status'] = 'completed'
+            print(f"✅ Task {i} completed")
+        
+        self.status.change_state('completed')
+        print("🎉 All AIOS tasks completed!")
+        
+    def get_workflow_status(self):
+        return {
+            'workflow_status': self.status.current_state,
+            'total_tasks': len(self.tasks),
+            'completed_tasks': len([t for t in self.tasks if t['status'] == 'completed']),
+            'pending_tasks': len([t for t in self.tasks if t['status'] == 'pending'])
+        }
+
+# Example usage
+if __name__ == "__main__":
+    workflow = AIOSProductivityWorkflow()
+    
+    # Add AI-powered productivity tasks
+    workflow.add_task("Configure AIOS", "setup", ["AI Stack", "LangChain"])
+    workflow.add_task("Install Dependencies", "installation", ["PyTorch", "Transformers"])
+    workflow.add_task("Test System", "testing", ["AutoGen", "MLflow"])
+    workflow.add_task("Create Agents", "development", ["DB-GPT", "BentoML"])
+    workflow.add_task("Deploy Models", "deployment", ["Ollama", "FastAPI"])
+    
+    # Execute workflow
+    workflow.execute_workflow()
+    
+    # Show results
+    print("\\n📊 AIOS Workflow Results:")
+    print(workflow.get_workflow_status())
+'''.encode()
+
+# Enhanced AIOS config; only ai_stack_integration.path depends on the agent, and
+# _configure_aios_integration fills it in without copying the rest
+_ENHANCED_CONFIG_SKELETON = {
+    "aios": {
+        "version": "0.2.2",
+        "environment": "production",
+        "ai_stack_integration": {
+            "enabled": True,
+            "path": None,
+            "components": {
+                "langchain": True,
+                "autogen": True,
+                "transformers": True,
+                "db_gpt": True,
+                "mlflow": True,
+                "bentoml": True,
+                "ollama": True
+            }
+        },
+        "agents": {
+            "max_concurrent": 10,
+            "default_timeout": 600,
+            "auto_scaling": True
+        },
+        "llm_providers": {
+            "ollama": {
+                "enabled": True,
+                "host": "http://localhost:11434",
+                "models": ["llama3", "mistral", "codellama", "neural-chat"]
+            },
+            "openai": {
+                "enabled": False,
+                "api_key": "",
+                "models": ["gpt-4", "gpt-3.5-turbo"]
+            }
+        }
+    }
+}
+
+@functools.cache
+def _get_aios_modules():
+    """Import AIOS on first use, so importing this module stays cheap"""
+    from aios.object import Object
+    from aios.state import State
+    return Object, State
+
 class AIOSBuilderAgent:
     def __init__(self, name="AIOSBuilder"):
+        Object, State = _get_aios_modules()
         self.agent = Object()
         self.name = name
         self.status = State(['idle', 'analyzing', 'building', 'testing', 'done', 'error'], 
@@ -21,13 +160,57 @@ class AIOSBuilderAgent:
         self.logger = logging.getLogger(f"aios.builder.{name}")
         self.working_dir = Path("/home/booze/ai-development")
         self.aios_env = self.working_dir / "environments" / "aios-env"
+        self._venv_pip = str(self.aios_env / "bin" / "pip")
+        self._venv_python = str(self.aios_env / "bin" / "python")
+        self._venv_ok = os.access(self._venv_python, os.X_OK) and os.access(self._venv_pip, os.X_OK)
+        self._setup_marker = self.working_dir / "ai-stack" / ".setup_complete"
+        self._setup_attempts_file = self.working_dir / "ai-stack" / ".setup_attempts"
+        self._site_packages = (self.aios_env / "lib" /
+                               f"python{sys.version_info.major}.{sys.version_info.minor}" / "site-packages")
+        self._analysis_cache = {}
+        self._last_test_ok_fingerprint = None
+        self._dirs_created = set()
         
+    def _ensure_dir(self, path):
+        """Create a directory once per agent; later calls skip the mkdir syscalls"""
+        if path not in self._dirs_created:
+            path.mkdir(parents=True, exist_ok=True)
+            self._dirs_created.add(path)
+    
+    def _fingerprint(self, *paths):
+        """mtime of each path, or None where missing, to detect filesystem changes"""
+        stamps = []
+        for path in paths:
+            try:
+                stamps.append(os.stat(path).st_mtime_ns)
+            except (FileNotFoundError, NotADirectoryError):
+                stamps.append(None)
+        return tuple(stamps)
+    
+    def _test_fingerprint(self):
+        """Fingerprint of the paths _test_complete_system depends on"""
+        return self._fingerprint(self.aios_env, self._site_packages, self.working_dir / "ai-stack")
+    
+    def _set_status_fast(self, state):
+        """Set the status without State.change_state validation or history; only for
+        internal transitions to states known to exist"""
+        self.status.current_state = state
+    
     def analyze_current_state(self):
         """Analyze current AIOS installation state"""
         try:
             self.status.change_state('analyzing')
             self.logger.info("Analyzing current AIOS state...")
             
+            # Reuse the previous result while none of the inspected paths have changed
+            ai_stack_dir = self.working_dir / "ai-stack"
+            config_dir = Path.home() / ".aios"
+            cache_key = self._fingerprint(self.aios_env, ai_stack_dir, config_dir)
+            if cache_key in self._analysis_cache:
+                analysis = self._analysis_cache[cache_key]
+                self.logger.info("Analysis unchanged: %s", analysis)
+                return self._copy_analysis(analysis)
+            
             analysis = {
                 'aios_installed': False,
                 'aios_version': None,
@@ -41,44 +224,52 @@ class AIOSBuilderAgent:
                 import aios
                 analysis['aios_installed'] = True
                 analysis['aios_version'] = getattr(aios, '__version__', 'Unknown')
-                self.logger.info(f"AIOS {analysis['aios_version']} detected")
+                self.logger.info("AIOS %s detected", analysis['aios_version'])
             except ImportError as e:
                 analysis['issues'].append(f"AIOS import failed: {e}")
             
+            # The cache key already holds a stat of each path; None means it is missing
+            _, ai_stack_mtime, config_mtime = cache_key
+            
             # Check AI stack
-            ai_stack_dir = self.working_dir / "ai-stack"
-            if ai_stack_dir.exists():
+            if ai_stack_mtime is not None:
                 analysis['ai_stack_ready'] = True
                 self.logger.info("AI Stack directory exists")
             else:
                 analysis['issues'].append("AI Stack not found")
             
             # Check configuration
-            config_dir = Path.home() / ".aios"
-            if config_dir.exists():
+            if config_mtime is not None:
                 analysis['config_exists'] = True
                 self.logger.info("AIOS configuration exists")
             else:
                 analysis['issues'].append("No AIOS configuration directory")
             
-            self.logger.info(f"Analysis complete: {analysis}")
-            return analysis
+            self.logger.info("Analysis complete: %s", analysis)
+            self._analysis_cache[cache_key] = analysis
+            return self._copy_analysis(analysis)
             
         except Exception as e:
-            self.logger.error(f"Analysis failed: {e}")
+            self.logger.error("Analysis failed: %s", e)
             self.status.change_state('error')
             return None
     
+    @staticmethod
+    def _copy_analysis(analysis):
+        """Copy a cached analysis so callers can't edit the cache through it"""
+        return {**analysis, 'issues': list(analysis['issues'])}
+    
     def build_full_aios(self):
         """Build the complete AIOS system using our AI stack"""
         try:
-            self.status.change_state('building')
+            self._set_status_fast('building')
             self.logger.info("Starting full AIOS build using AI stack...")
             
             # Step 1: Set up AI stack if not ready
-            if not (self.working_dir / "ai-stack").exists():
-                self.logger.info("Setting up AI stack first...")
-                self._setup_ai_stack()
+            if not self._setup_ai_stack():
+                self.logger.error("AIOS system build failed")
+                self._set_status_fast('error')
+                return False
             
             # Step 2: Configure AIOS with AI stack integration
             self.logger.info("Configuring AIOS with AI stack...")
@@ -86,106 +277,141 @@ class AIOSBuilderAgent:
             
             # Step 3: Install missing AIOS components
             self.logger.info("Installing missing AIOS components...")
-            self._install_aios_components()
+            if not self._install_aios_components():
+                self.logger.error("AIOS system build failed")
+                self._set_status_fast('error')
+                return False
             
             # Step 4: Test the complete system
             self.logger.info("Testing complete AIOS system...")
             test_result = self._test_complete_system()
             
             if test_result:
-                self.status.change_state('testing')
+                self._set_status_fast('testing')
                 self.logger.info("AIOS system built successfully!")
                 return True
             else:
                 self.logger.error("AIOS system build failed")
-                self.status.change_state('error')
+                self._set_status_fast('error')
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Build failed: {e}")
-            self.status.change_state('error')
+            self.logger.error("Build failed: %s", e)
+            self._set_status_fast('error')
             return False
     
     def _setup_ai_stack(self):
-        """Set up the AI stack if not ready"""
+        """Set up the AI stack if not ready; returns False once setup has failed too often"""
         try:
+            # Part 1 creates ai-stack before anything else, so the directory alone doesn't
+            # mean setup finished; a marker written after a successful run does
+            if self._setup_marker.exists():
+                self.logger.info("AI stack already set up")
+                return True
+            attempts = self._setup_attempts()
+            # Installs from before the marker existed have no attempt count; once Part 3 has
+            # written its master script, treat them as set up rather than re-running it all
+            if attempts is None and (self._setup_marker.parent / "run_full_integration.py").exists():
+                self._setup_marker.touch()
+                self.logger.info("AI stack already set up")
+                return True
+            attempts = attempts or 0
+            if attempts >= MAX_SETUP_ATTEMPTS:
+                self.logger.error("❌ AI stack setup failed %d times; set %s to 0 to retry",
+                                  attempts, self._setup_attempts_file)
+                return False
+            self.logger.info("Setting up AI stack first...")
+            
             # Run AI stack setup
             setup_script = self.working_dir / "ai_stack_master.py"
             if setup_script.exists():
                 self.logger.info("Running AI stack setup...")
-                result = subprocess.run([sys.executable, str(setup_script)], 
-                                      capture_output=True, text=True, cwd=self.working_dir)
-                if result.returncode == 0:
+                # Counted before the run so an interrupted setup is counted too
+                self._ensure_dir(self._setup_attempts_file.parent)
+                self._setup_attempts_file.write_text(str(attempts + 1))
+                # Own session so a timeout can kill the parts the master spawned, not just the master
+                proc = subprocess.Popen([sys.executable, str(setup_script)],
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, cwd=self.working_dir,
+                                        start_new_session=True)
+                try:
+                    _, stderr = proc.communicate(timeout=SETUP_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                    proc.communicate()
+                    self.logger.warning("AI stack setup timed out after %ds", SETUP_TIMEOUT)
+                    return True
+                if proc.returncode == 0:
+                    self._setup_marker.touch()
+                    self._setup_attempts_file.unlink(missing_ok=True)
                     self.logger.info("AI stack setup completed")
                 else:
-                    self.logger.warning(f"AI stack setup had issues: {result.stderr}")
+                    self.logger.warning("AI stack setup had issues: %s", stderr.decode('utf-8', errors='replace'))
             else:
                 self.logger.warning("AI stack setup script not found")
                 
         except Exception as e:
-            self.logger.error(f"AI stack setup failed: {e}")
+            self.logger.error("AI stack setup failed: %s", e)
+        return True
+    
+    def _setup_attempts(self):
+        """Number of unfinished setup runs so far, or None if setup was never attempted"""
+        try:
+            return int(self._setup_attempts_file.read_text())
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            return 0
     
     def _configure_aios_integration(self):
         """Configure AIOS integration with AI stack"""
         try:
             # Create enhanced AIOS configuration
             config_dir = Path.home() / ".aios"
-            config_dir.mkdir(exist_ok=True)
+            self._ensure_dir(config_dir)
             
-            # Enhanced AIOS config with AI stack integration
+            # Enhanced AIOS config with AI stack integration. The skeleton is only
+            # serialized, so untouched sections are shared rather than copied
+            skeleton = _ENHANCED_CONFIG_SKELETON["aios"]
             enhanced_config = {
                 "aios": {
-                    "version": "0.2.2",
-                    "environment": "production",
+                    **skeleton,
                     "ai_stack_integration": {
-                        "enabled": True,
-                        "path": str(self.working_dir / "ai-stack"),
-                        "components": {
-                            "langchain": True,
-                            "autogen": True,
-                            "transformers": True,
-                            "db_gpt": True,
-                            "mlflow": True,
-                            "bentoml": True,
-                            "ollama": True
-                        }
-                    },
-                    "agents": {
-                        "max_concurrent": 10,
-                        "default_timeout": 600,
-                        "auto_scaling": True
-                    },
-                    "llm_providers": {
-                        "ollama": {
-                            "enabled": True,
-                            "host": "http://localhost:11434",
-                            "models": ["llama3", "mistral", "codellama", "neural-chat"]
-                        },
-                        "openai": {
-                            "enabled": False,
-                            "api_key": "",
-                            "models": ["gpt-4", "gpt-3.5-turbo"]
-                        }
+                        **skeleton["ai_stack_integration"],
+                        "path": str(self.working_dir / "ai-stack")
                     }
                 }
             }
             
             # Save enhanced config
             config_file = config_dir / "enhanced_aios_config.json"
-            import json
-            with open(config_file, 'w') as f:
-                json.dump(enhanced_config, f, indent=2)
+            # Write a uniquely named file beside the target and rename, so readers never see
+            # a partial file and concurrent builders don't share a temp file
+            tmp_file = tempfile.NamedTemporaryFile(dir=config_dir, prefix=f"{config_file.name}.",
+                                                   suffix=".tmp", delete=False)
+            try:
+                with tmp_file:
+                    tmp_file.write(dump_json(enhanced_config))
+                    # NamedTemporaryFile creates 0600 and the rename keeps it; stay world-readable
+                    os.fchmod(tmp_file.fileno(), 0o644)
+                os.replace(tmp_file.name, config_file)
+            except BaseException:
+                os.unlink(tmp_file.name)
+                raise
             
-            self.logger.info(f"Enhanced AIOS config saved to {config_file}")
+            self.logger.info("Enhanced AIOS config saved to %s", config_file)
             
         except Exception as e:
-            self.logger.error(f"AIOS integration configuration failed: {e}")
+            self.logger.error("AIOS integration configuration failed: %s", e)
     
     def _install_aios_components(self):
         """Install missing AIOS components"""
+        if not self._venv_ok:
+            self.logger.error("❌ AIOS environment not found or not executable: %s", self.aios_env)
+            return False
+        
         try:
             # Activate AIOS environment
-            pip_cmd = str(self.aios_env / "bin" / "pip")
+            pip_install = [self._venv_pip, "install", "--disable-pip-version-check", "--no-input"]
             
             # Core AIOS dependencies
             aios_dependencies = [
@@ -193,26 +419,105 @@ class AIOSBuilderAgent:
                 "sentence-transformers", "nltk", "scikit-learn"
             ]
             
-            for dep in aios_dependencies:
-                try:
-                    self.logger.info(f"Installing AIOS dependency: {dep}")
-                    result = subprocess.run([pip_cmd, "install", dep], 
-                                          capture_output=True, text=True)
-                    if result.returncode == 0:
-                        self.logger.info(f"✅ {dep} installed")
+            # One pip run so the resolver sees the whole set and fetches index data once
+            try:
+                self.logger.info("Installing AIOS dependencies: %s", ', '.join(aios_dependencies))
+                result = subprocess.run([*pip_install, *aios_dependencies], 
+                                      stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=INSTALL_TIMEOUT)
+                if result.returncode == 0:
+                    # Only pip's summary line is logged, so only that line is decoded
+                    for line in result.stdout.splitlines():
+                        if line.startswith(b"Successfully installed "):
+                            self.logger.info("✅ %s", line.decode('utf-8', errors='replace'))
+                    self.logger.info("✅ %s installed", ', '.join(aios_dependencies))
+                    return True
+                self.logger.warning("⚠️ Batch install had issues: %s", result.stderr.decode('utf-8', errors='replace'))
+            except subprocess.TimeoutExpired as e:
+                # Retrying package by package would stall the same way
+                self.logger.error("❌ Batch install timed out: %s", e)
+                return False
+            except Exception as e:
+                self.logger.warning("⚠️ Batch install failed: %s", e)
+            
+            # One bad requirement fails the whole resolve, so retry individually. Concurrent
+            # installs into one venv race on shared dependencies, so only the downloads run
+            # in parallel, each into its own directory since their dependency trees overlap;
+            # each package is then installed preferring its local wheels in turn. The index
+            # stays reachable because pip download doesn't fetch sdist build deps
+            self.logger.info("Retrying AIOS dependencies individually...")
+            with tempfile.TemporaryDirectory() as wheel_dir:
+                with ThreadPoolExecutor(max_workers=min(8, len(aios_dependencies))) as executor:
+                    downloads = list(executor.map(
+                        lambda dep: self._pip_download_one(os.path.join(wheel_dir, dep), dep),
+                        aios_dependencies))
+                
+                # A stalled download means the index is unreachable; the installs would stall too
+                for dep, error in downloads:
+                    if isinstance(error, subprocess.TimeoutExpired):
+                        self.logger.error("❌ Download of %s timed out: %s", dep, error)
+                        return False
+                
+                for dep, error in downloads:
+                    # Without a local download, pip install still gets its own try from the index
+                    if error is None:
+                        find_links = ["--find-links", os.path.join(wheel_dir, dep)]
                     else:
-                        self.logger.warning(f"⚠️ {dep} installation had issues")
-                except Exception as e:
-                    self.logger.warning(f"⚠️ Failed to install {dep}: {e}")
+                        self.logger.warning("⚠️ Failed to download %s: %s", dep, error)
+                        find_links = []
+                    try:
+                        self.logger.info("Installing AIOS dependency: %s", dep)
+                        result = subprocess.run([*pip_install, *find_links, dep], 
+                                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                              timeout=INSTALL_TIMEOUT)
+                        if result.returncode == 0:
+                            self.logger.info("✅ %s installed", dep)
+                        else:
+                            self.logger.warning("⚠️ %s installation had issues", dep)
+                    except subprocess.TimeoutExpired as e:
+                        self.logger.error("❌ Installing %s timed out, giving up: %s", dep, e)
+                        return False
+                    except Exception as e:
+                        self.logger.warning("⚠️ Failed to install %s: %s", dep, e)
+            
+            # Separate installs never saw each other's requirements, so check they agree
+            result = subprocess.run([self._venv_pip, "check", "--disable-pip-version-check"],
+                                  stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=TEST_TIMEOUT)
+            if result.returncode != 0:
+                self.logger.warning("⚠️ Dependency conflicts: %s", result.stdout.decode('utf-8', errors='replace'))
             
             return True
             
         except Exception as e:
-            self.logger.error(f"AIOS component installation failed: {e}")
+            self.logger.error("AIOS component installation failed: %s", e)
             return False
     
+    def _pip_download_one(self, dest, dep):
+        """Download a dependency and its requirements into dest; returns (dep, error or None)
+
+        A timeout comes back as the TimeoutExpired itself so the caller can abort.
+        """
+        try:
+            result = subprocess.run([self._venv_pip, "download", "--disable-pip-version-check", "--no-input",
+                                     "--dest", dest, dep], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                    timeout=INSTALL_TIMEOUT)
+            return dep, None if result.returncode == 0 else result.stderr.decode('utf-8', errors='replace')
+        except Exception as e:
+            return dep, e
+    
     def _test_complete_system(self):
         """Test the complete AIOS system"""
+        if not self._venv_ok:
+            self.logger.error("❌ AIOS environment not found or not executable: %s", self.aios_env)
+            return False
+        
+        fingerprint = self._test_fingerprint()
+        if self._run_system_tests():
+            self._last_test_ok_fingerprint = fingerprint
+            return True
+        return False
+    
+    def _run_system_tests(self):
+        """Run the AIOS core and AI stack integration tests"""
         try:
             # Test AIOS core
             aios_test = """
@@ -226,15 +531,6 @@ status = State(['idle', 'working'], name='test', default='idle')
 print(f"✅ AIOS core test passed: Agent={agent}, Status={status}")
 """
             
-            result = subprocess.run([str(self.aios_env / "bin" / "python"), "-c", aios_test],
-                                  capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                self.logger.info("✅ AIOS core test passed")
-            else:
-                self.logger.error(f"❌ AIOS core test failed: {result.stderr}")
-                return False
-            
             # Test AI stack integration
             integration_test = """
 import sys
@@ -264,112 +560,128 @@ except ImportError:
 print("✅ AI stack integration test passed")
 """
             
-            result = subprocess.run([str(self.aios_env / "bin" / "python"), "-c", integration_test],
-                                  capture_output=True, text=True)
+            # The core test has to import and construct aios objects, so it always runs
+            # in the venv's interpreter
+            core_proc = subprocess.Popen([self._venv_python, "-c", aios_test],
+                                         stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            
+            # The integration test only looks for modules; a venv on this interpreter's
+            # Python version can answer that in-process while the core test runs, and
+            # anything the lookup can't settle goes to the venv's interpreter as well
+            components = None
+            if self._site_packages.is_dir():
+                components = self._probe_components(self._site_packages)
+            integration_proc = None
+            if components is None:
+                integration_proc = subprocess.Popen([self._venv_python, "-c", integration_test],
+                                                    stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            
+            try:
+                _, core_stderr = core_proc.communicate(timeout=TEST_TIMEOUT)
+                if integration_proc is not None:
+                    _, integration_stderr = integration_proc.communicate(timeout=TEST_TIMEOUT)
+            except subprocess.TimeoutExpired as e:
+                for proc in (core_proc, integration_proc):
+                    if proc is not None:
+                        proc.kill()
+                        proc.wait()
+                self.logger.error("❌ System test timed out: %s", e)
+                return False
+            
+            if core_proc.returncode == 0:
+                self.logger.info("✅ AIOS core test passed")
+            else:
+                self.logger.error("❌ AIOS core test failed: %s", core_stderr.decode('utf-8', errors='replace'))
+                return False
             
-            if result.returncode == 0:
+            if integration_proc is None:
+                return self._report_integration(components)
+            
+            if integration_proc.returncode == 0:
                 self.logger.info("✅ AI stack integration test passed")
                 return True
             else:
-                self.logger.error(f"❌ AI stack integration test failed: {result.stderr}")
+                self.logger.error("❌ AI stack integration test failed: %s", integration_stderr.decode('utf-8', errors='replace'))
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Complete system test failed: {e}")
+            self.logger.error("Complete system test failed: %s", e)
+            return False
+    
+    def _site_paths(self, site_packages):
+        """site-packages plus the directories its .pth files add, and whether any .pth
+        file also has import lines (e.g. editable install hooks)"""
+        search_path = [str(site_packages)]
+        has_hooks = False
+        for pth_file in sorted(site_packages.glob("*.pth")):
+            try:
+                lines = pth_file.read_text(encoding="utf-8").splitlines()
+            except (OSError, UnicodeDecodeError):
+                has_hooks = True
+                continue
+            for line in lines:
+                line = line.rstrip()
+                if not line or line.startswith("#"):
+                    continue
+                if line.startswith(("import ", "import\t")):
+                    has_hooks = True
+                    continue
+                path = site_packages / line
+                if path.is_dir():
+                    search_path.append(str(path))
+        return search_path, has_hooks
+    
+    def _probe_components(self, site_packages):
+        """Look up the integration test's components in the venv's site-packages as
+        (label, available) pairs; None when only the venv's interpreter can tell"""
+        # PathFinder searches only the venv, ignoring sys.path and anything already imported
+        # here. Import lines in .pth files only run inside the venv, so when there are any
+        # a module that isn't found may still be importable there.
+        search_path, has_hooks = self._site_paths(site_packages)
+        components = [(label, PathFinder.find_spec(module, search_path) is not None)
+                      for module, label in (("torch", "PyTorch"), ("langchain", "LangChain"))]
+        if has_hooks and not all(available for _, available in components):
+            return None
+        return components
+    
+    def _report_integration(self, components):
+        """Finish the AI stack integration test from in-process component lookups"""
+        if not (self.working_dir / "ai-stack").exists():
+            self.logger.error("❌ AI stack integration test failed: AI stack directory not found")
             return False
+        for label, available in components:
+            if available:
+                self.logger.info("✅ %s available", label)
+            else:
+                self.logger.warning("⚠️ %s not available", label)
+        self.logger.info("✅ AI stack integration test passed")
+        return True
     
     def create_productivity_workflow(self):
         """Create a productivity workflow using the complete AIOS system"""
         try:
             self.logger.info("Creating AIOS productivity workflow...")
             
-            workflow_code = """
-#!/usr/bin/env python3
-\"\"\"
-AIOS Productivity Workflow
-Demonstrates the complete AIOS system with AI stack integration
-\"\"\"
-
-from aios.object import Object
-from aios.state import State
-import time
-
-class AIOSProductivityWorkflow:
-    def __init__(self):
-        self.workflow = Object()
-        self.status = State(['planning', 'executing', 'monitoring', 'completed'], 
-                           name='workflow_status', default='planning')
-        self.tasks = []
-        
-    def add_task(self, task_name, task_type, ai_tools=None):
-        task = {
-            'name': task_name,
-            'type': task_type,
-            'status': 'pending',
-            'agent': Object(),
-            'ai_tools': ai_tools or []
-        }
-        self.tasks.append(task)
-        print(f"✅ Task added: {task_name}")
-        
-    def execute_workflow(self):
-        self.status.change_state('executing')
-        print(f"🚀 Executing AIOS workflow with {len(self.tasks)} tasks...")
-        
-        for i, task in enumerate(self.tasks, 1):
-            print(f"📋 Task {i}: {task['name']} ({task['type']})")
-            task['status'] = 'in_progress'
-            
-            # Simulate AI-powered work
-            if task['ai_tools']:
-                print(f"   🤖 Using AI tools: {', '.join(task['ai_tools'])}")
-            
-            time.sleep(0.5)
-            task['status'] = 'completed'
-            print(f"✅ Task {i} completed")
-        
-        self.status.change_state('completed')
-        print("🎉 All AIOS tasks completed!")
-        
-    def get_workflow_status(self):
-        return {
-            'workflow_status': self.status.current_state,
-            'total_tasks': len(self.tasks),
-            'completed_tasks': len([t for t in self.tasks if t['status'] == 'completed']),
-            'pending_tasks': len([t for t in self.tasks if t['status'] == 'pending'])
-        }
-
-# Example usage
-if __name__ == "__main__":
-    workflow = AIOSProductivityWorkflow()
-    
-    # Add AI-powered productivity tasks
-    workflow.add_task("Configure AIOS", "setup", ["AI Stack", "LangChain"])
-    workflow.add_task("Install Dependencies", "installation", ["PyTorch", "Transformers"])
-    workflow.add_task("Test System", "testing", ["AutoGen", "MLflow"])
-    workflow.add_task("Create Agents", "development", ["DB-GPT", "BentoML"])
-    workflow.add_task("Deploy Models", "deployment", ["Ollama", "FastAPI"])
-    
-    # Execute workflow
-    workflow.execute_workflow()
-    
-    # Show results
-    print("\\n📊 AIOS Workflow Results:")
-    print(workflow.get_workflow_status())
-"""
-            
             # Save workflow
             workflow_file = Path.home() / ".aios" / "templates" / "aios_productivity_workflow.py"
-            workflow_file.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(workflow_file.parent)
             
-            with open(workflow_file, 'w') as f:
-                f.write(workflow_code)
+            # Rewriting identical content would only bump the mtime and dirty the page cache
+            try:
+                unchanged = workflow_file.read_bytes() == _WORKFLOW_TEMPLATE
+            except FileNotFoundError:
+                unchanged = False
+            if unchanged:
+                self.logger.info("✅ AIOS productivity workflow up to date: %s", workflow_file)
+                return True
             
-            self.logger.info(f"✅ AIOS productivity workflow created: {workflow_file}")
+            workflow_file.write_bytes(_WORKFLOW_TEMPLATE)
+            
+            self.logger.info("✅ AIOS productivity workflow created: %s", workflow_file)
             return True
             
         except Exception as e:
-            self.logger.error(f"Workflow creation failed: {e}")
+            self.logger.error("Workflow creation failed: %s", e)
             return False
     
     def get_status(self):
@@ -384,6 +696,10 @@ if __name__ == "__main__":
     
     def run_full_build(self):
         """Run the complete AIOS build process"""
+        return asyncio.run(self.run_full_build_async())
+    
+    async def run_full_build_async(self):
+        """Run the complete AIOS build process, overlapping independent stages"""
         try:
             self.logger.info("🚀 Starting complete AIOS build process...")
             
@@ -392,32 +708,37 @@ if __name__ == "__main__":
             if not analysis:
                 return False
             
-            # Step 2: Build full system
-            build_success = self.build_full_aios()
+            # Steps 2 and 3: the workflow template only touches ~/.aios/templates, so
+            # write it while the build waits on its setup, pip and test subprocesses
+            build_success, workflow_success = await asyncio.gather(
+                asyncio.to_thread(self.build_full_aios),
+                asyncio.to_thread(self.create_productivity_workflow)
+            )
             if not build_success:
                 return False
-            
-            # Step 3: Create productivity workflow
-            workflow_success = self.create_productivity_workflow()
             if not workflow_success:
                 self.logger.warning("Workflow creation failed, but system is built")
             
-            # Step 4: Final testing
-            self.status.change_state('testing')
-            final_test = self._test_complete_system()
+            # Step 4: Final testing, unless nothing changed since the build's test passed
+            self._set_status_fast('testing')
+            if self._last_test_ok_fingerprint == self._test_fingerprint():
+                self.logger.info("✅ System unchanged since the last passing test, skipping final test")
+                final_test = True
+            else:
+                final_test = self._test_complete_system()
             
             if final_test:
-                self.status.change_state('done')
+                self._set_status_fast('done')
                 self.logger.info("🎉 Complete AIOS build completed successfully!")
                 return True
             else:
-                self.status.change_state('error')
+                self._set_status_fast('error')
                 self.logger.error("❌ Final testing failed")
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Full build process failed: {e}")
-            self.status.change_state('error')
+            self.logger.error("Full build process failed: %s", e)
+            self._set_status_fast('error')
             return False
 
 # Main execution